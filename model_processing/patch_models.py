@@ -1,10 +1,14 @@
 import ast
 import importlib.util
 import logging
+import os
 import re
 import subprocess
 import sys
+import tempfile
 import yaml
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -15,6 +19,34 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once here rather than on every call (or every line).
+# Possessive quantifiers (*+, ++) never give back what they matched, so a
+# failed match on odd generated output cannot backtrack.
+CLASS_DEF_RE = re.compile(r"^class (\w++)\(")
+MODEL_REBUILD_RE = re.compile(r"^\w++\.model_rebuild\(\)$")
+TYPING_IMPORT_RE = re.compile(
+    r"^from typing import (?:\(([^)]*+)\)|([^(\n]++)$)", re.MULTILINE
+)
+REQUIRED_TYPING_IMPORTS = ("Annotated", "Union", "TypeAlias", "Literal")
+DISCRIMINATOR_FIELD_RE = re.compile(r'Field\(discriminator="[^"]++"\)')
+FIELD_DESCRIPTION_RE = re.compile(r',\s*+description="""(?:[^"]++|"(?!""))*+"""')
+LITERAL_DISCRIMINATOR_RE = re.compile(
+    r"Literal\[TransformationType\.\w++\]|Literal\[AnnotationType\.\w++\]"
+)
+
+
+@lru_cache(maxsize=64)
+def optional_list_field_re(field_name: str) -> re.Pattern[str]:
+    """Pattern for `field_name: Optional[list[BaseType]]`, compiled once per field"""
+    return re.compile(rf"({field_name}:\s*+Optional\[list\[)(\w++)(\]\])")
+
+
+@lru_cache(maxsize=64)
+def discriminator_default_re(discriminators: tuple[str, ...]) -> re.Pattern[str]:
+    """Pattern for `discriminator: EnumType = Field(default=EnumType.value`"""
+    names = "|".join(re.escape(d) for d in discriminators)
+    return re.compile(rf"({names}): (\w++) = Field\(default=(\w++\.\w++)")
+
 
 def load_patch_config_yaml():
     config_path = Path(__file__).parent / "patch_config.yaml"
@@ -74,101 +106,68 @@ def patch_field_with_union(
         discriminator: Discriminator field name
         union_types: List of types to include in the union
         for_classes: Optional list of class names to restrict patching to.
-                     If None, patches all occurrences of the field.
+                     If None, patches the field in all classes.
     """
 
-    if for_classes is None:
-        return patch_field_global(model_def, field_name, discriminator, union_types)
-    else:
-        return patch_field_in_classes(
-            model_def, field_name, discriminator, union_types, for_classes
-        )
-
-
-def patch_field_global(
-    model_def: str, field_name: str, discriminator: str, union_types: list[str]
-) -> str:
-    """Patch field globally (all classes) - original behavior"""
-    pattern = rf"({field_name}:\s*Optional\[list\[)(\w+)(\]\])"
-
-    if not union_types:
-        # If no union_types specified, just wrap the existing type with Annotated
-        replacement = rf'\1Annotated[\2, Field(discriminator="{discriminator}")]\3'
-        return re.sub(pattern, replacement, model_def)
-
-    union_str = "Union[" + ", ".join(union_types) + "]"
-    replacement = rf'\1Annotated[{union_str}, Field(discriminator="{discriminator}")]\3'
-
-    return re.sub(pattern, replacement, model_def)
-
-
-def patch_field_in_classes(
-    model_def: str,
-    field_name: str,
-    discriminator: str,
-    union_types: list[str],
-    class_names: list[str],
-) -> str:
-    """Patch field only in specified classes"""
     lines = model_def.split("\n")
-
-    # Track which class we're currently in
-    current_class = None
+    pattern = optional_list_field_re(field_name)
+    union_str = "Union[" + ", ".join(union_types) + "]" if union_types else None
     patched_count = 0
 
-    for i, line in enumerate(lines):
-        # Detect class definition
-        class_match = re.match(r"^class (\w+)\(", line)
-        if class_match:
-            current_class = class_match.group(1)
+    # Single pass over the class bodies instead of a whole-file regex sweep
+    for class_name, start, end in iter_class_blocks(lines):
+        if for_classes is not None and class_name not in for_classes:
             continue
 
-        # Reset current class when we dedent back to module level
-        if current_class and line and not line[0].isspace():
-            current_class = None
-            continue
+        for i in range(start, end):
+            line = lines[i]
+            match = pattern.search(line)
+            if not match:
+                continue
 
-        # Only process if we're in one of the target classes
-        if current_class not in class_names:
-            continue
-
-        # Look for the field pattern
-        pattern = rf"(\s*)({field_name}:\s*Optional\[list\[)(\w+)(\]\])"
-        match = re.search(pattern, line)
-
-        if match:
-            indent = match.group(1)
-            field_prefix = match.group(2)
-            base_type = match.group(3)
-            field_suffix = match.group(4)
-
-            if union_types:
-                union_str = "Union[" + ", ".join(union_types) + "]"
-                new_type = (
-                    f'Annotated[{union_str}, Field(discriminator="{discriminator}")]'
-                )
-            else:
-                # Just wrap existing type
-                new_type = (
-                    f'Annotated[{base_type}, Field(discriminator="{discriminator}")]'
-                )
-
-            # Reconstruct the line
-            rest_of_line = line[match.end() :]
-            lines[i] = f"{indent}{field_prefix}{new_type}{field_suffix}{rest_of_line}"
+            # Wrap the existing type if no union_types are specified
+            inner_type = union_str or match.group(2)
+            new_type = (
+                f'Annotated[{inner_type}, Field(discriminator="{discriminator}")]'
+            )
+            lines[i] = (
+                f"{line[: match.start()]}{match.group(1)}{new_type}"
+                f"{match.group(3)}{line[match.end() :]}"
+            )
             patched_count += 1
             logger.debug(
-                f"    ✓ Patched '{field_name}' in class '{current_class}' (line {i + 1})"
+                f"    ✓ Patched '{field_name}' in class '{class_name}' (line {i + 1})"
             )
 
-    if patched_count == 0:
+    if patched_count == 0 and for_classes is not None:
         logger.warning(
-            f"    ⚠ Warning: Field '{field_name}' not found in classes {class_names}"
+            f"    ⚠ Warning: Field '{field_name}' not found in classes {for_classes}"
         )
 
     return "\n".join(lines)
 
 
+def iter_class_blocks(lines: list[str]) -> Iterator[tuple[str, int, int]]:
+    """
+    Yield (class_name, start, end) for each top-level class, such that
+    lines[start:end] is the class body. A class ends at the next line
+    that is back at module level.
+    """
+    current_class = None
+    start = 0
+
+    for i, line in enumerate(lines):
+        class_match = CLASS_DEF_RE.match(line)
+        if class_match or (current_class and line and not line[0].isspace()):
+            if current_class:
+                yield current_class, start, i
+            current_class = class_match.group(1) if class_match else None
+            start = i + 1
+
+    if current_class:
+        yield current_class, start, len(lines)
+
+
 def patch_discriminator_fields_to_literal(model_def: str, unions: list) -> str:
     """
     Convert discriminator fields from Enum types to Literal types in subclasses.
@@ -187,39 +186,29 @@ def patch_discriminator_fields_to_literal(model_def: str, unions: list) -> str:
         f"Converting discriminator fields to Literal: {', '.join(discriminators)}"
     )
 
-    for discriminator in discriminators:
-        lines = model_def.split("\n")
-        for i, line in enumerate(lines):
-            if f"{discriminator}: " in line and " = Field(" in line:
-                # Skip base class (has default=...)
-                if "default=..." in line:
-                    continue
-
-                # Match: transformation_type: TransformationType = Field(default=TransformationType.identity, ...)
-                match = re.search(
-                    rf"{discriminator}: (\w+) = Field\(default=(\w+\.\w+)", line
-                )
-                if match:
-                    enum_type = match.group(1)  # TransformationType
-                    enum_value = match.group(2)  # TransformationType.identity
-
-                    # Replace: EnumType with Literal[EnumType.value] and remove default=
-                    old_pattern = (
-                        f"{discriminator}: {enum_type} = Field(default={enum_value}"
-                    )
-                    new_pattern = (
-                        f"{discriminator}: Literal[{enum_value}] = Field({enum_value}"
-                    )
-
-                    if old_pattern in line:
-                        lines[i] = line.replace(old_pattern, new_pattern)
-                        logger.debug(
-                            f"  - Converted {discriminator} from {enum_type} to Literal on line {i}"
-                        )
-
-        model_def = "\n".join(lines)
+    # All discriminators are converted in a single pass over the lines
+    pattern = discriminator_default_re(tuple(sorted(discriminators)))
+    lines = model_def.split("\n")
+    for i, line in enumerate(lines):
+        # Skip base class (has default=...)
+        if " = Field(default=" not in line or "default=..." in line:
+            continue
 
-    return model_def
+        # Match: transformation_type: TransformationType = Field(default=TransformationType.identity, ...)
+        match = pattern.search(line)
+        if match:
+            discriminator = match.group(1)
+            enum_type = match.group(2)  # TransformationType
+            enum_value = match.group(3)  # TransformationType.identity
+
+            # Replace: EnumType with Literal[EnumType.value] and remove default=
+            new_pattern = f"{discriminator}: Literal[{enum_value}] = Field({enum_value}"
+            lines[i] = line[: match.start()] + new_pattern + line[match.end() :]
+            logger.debug(
+                f"  - Converted {discriminator} from {enum_type} to Literal on line {i}"
+            )
+
+    return "\n".join(lines)
 
 
 def add_type_aliases(model_def: str, aliases: list[dict]) -> str:
@@ -244,6 +233,8 @@ def add_type_aliases(model_def: str, aliases: list[dict]) -> str:
             model_def[:insertion_point] + alias_block + model_def[insertion_point:]
         )
 
+    # Collect every field substitution so they can be applied in one pass
+    substitutions: dict[str, tuple[str, bool]] = {}
     for alias in aliases:
         if "for_field" not in alias:
             continue
@@ -252,83 +243,69 @@ def add_type_aliases(model_def: str, aliases: list[dict]) -> str:
         for_field = alias["for_field"]
 
         if isinstance(for_field, dict):
-            as_list_fields = for_field.get("as_list", [])
-            as_single_fields = for_field.get("as_single", [])
-
-            for field_name in as_list_fields:
-                model_def = substitute_field_type(
-                    model_def, field_name, alias_name, as_list=True
-                )
-
-            for field_name in as_single_fields:
-                model_def = substitute_field_type(
-                    model_def, field_name, alias_name, as_list=False
-                )
+            for field_name in for_field.get("as_list", []):
+                substitutions.setdefault(field_name, (alias_name, True))
+            for field_name in for_field.get("as_single", []):
+                substitutions.setdefault(field_name, (alias_name, False))
         else:
             for field_name in for_field:
-                model_def = substitute_field_type(
-                    model_def, field_name, alias_name, as_list=True
-                )
+                substitutions.setdefault(field_name, (alias_name, True))
 
-    return model_def
+    return substitute_field_types(model_def, substitutions)
 
 
-def substitute_field_type(
-    model_def: str, field_name: str, alias_name: str, as_list: bool
+def substitute_field_types(
+    model_def: str, substitutions: dict[str, tuple[str, bool]]
 ) -> str:
     """
-    Substitute a field's type with a type alias.
+    Substitute field types with type aliases.
 
     Args:
         model_def: The model definition string
-        field_name: Name of the field to replace
-        alias_name: Name of the type alias to use
-        as_list: If True, wraps in list with min_length=1. If False, uses alias directly.
+        substitutions: Maps the name of each field to replace to a tuple of
+            (alias_name, as_list). If as_list is True, the alias is wrapped in
+            a list with min_length=1. If False, the alias is used directly.
 
     Returns:
         Updated model definition
     """
-    test_pattern = f"{field_name}: Optional[conlist"
+    lines = model_def.split("\n")
+    counts = dict.fromkeys(substitutions, 0)
+    # Find where the type annotation ends (at )] = )
+    end_marker = ")] = Field"
 
-    if test_pattern not in model_def:
-        logger.debug(f"  ✗ Substring not found for '{field_name}'")
-        return model_def
+    for i, line in enumerate(lines):
+        if ": Optional[conlist" not in line or end_marker not in line:
+            continue
 
-    logger.debug(
-        f"  - Found substring '{test_pattern}' for {field_name} (as_list={as_list})"
-    )
+        field_name = line.lstrip().split(":", 1)[0]
+        if field_name not in substitutions:
+            continue
 
-    lines = model_def.split("\n")
-    count = 0
+        alias_name, as_list = substitutions[field_name]
+        start = line.find(f"{field_name}: Optional[")
+        end = line.find(end_marker) + 1  # Include the ]
 
-    for i, line in enumerate(lines):
-        if test_pattern in line:
-            # Find where the type annotation ends (at )] = )
-            end_marker = ")] = Field"
-            if end_marker in line:
-                start = line.find(f"{field_name}: Optional[")
-                end = line.find(end_marker) + 1  # Include the ]
-
-                if start != -1 and end != -1:
-                    before = line[:start]
-                    after = line[end:]
-
-                    if as_list:
-                        # Wrap in list with min_length constraint
-                        new_type = f"{field_name}: Optional[Annotated[list[{alias_name}], Field(min_length=1)]"
-                    else:
-                        # Use alias directly (single value)
-                        new_type = f"{field_name}: Optional[{alias_name}"
-
-                    lines[i] = before + new_type + after
-                    count += 1
-
-    model_def = "\n".join(lines)
-    logger.debug(
-        f"  - Replaced {count} occurrence(s) of '{field_name}' (as_list={as_list})"
-    )
+        if as_list:
+            # Wrap in list with min_length constraint
+            new_type = f"{field_name}: Optional[Annotated[list[{alias_name}], Field(min_length=1)]"
+        else:
+            # Use alias directly (single value)
+            new_type = f"{field_name}: Optional[{alias_name}"
 
-    return model_def
+        lines[i] = line[:start] + new_type + line[end:]
+        counts[field_name] += 1
+
+    for field_name, count in counts.items():
+        alias_name, as_list = substitutions[field_name]
+        if count:
+            logger.debug(
+                f"  - Replaced {count} occurrence(s) of '{field_name}' (as_list={as_list})"
+            )
+        else:
+            logger.debug(f"  ✗ Substring not found for '{field_name}'")
+
+    return "\n".join(lines)
 
 
 def ensure_typing_imports(model_def: str) -> str:
@@ -336,38 +313,154 @@ def ensure_typing_imports(model_def: str) -> str:
     Ensure Annotated, Union, TypeAlias, and Literal are in the typing imports.
     """
 
-    typing_section = model_def.split("from pydantic import")[0]
+    match = TYPING_IMPORT_RE.search(model_def)
 
-    needs_annotated = "Annotated" not in typing_section
-    needs_union = "Union" not in typing_section
-    needs_typealias = "TypeAlias" not in typing_section
-    needs_literal = "Literal" not in typing_section
+    if not match:
+        logger.warning("Could not find typing imports")
+        return model_def
+
+    parenthesized = match.group(1) is not None
+    names = match.group(1) if parenthesized else match.group(2)
+    existing = {name.strip() for name in names.split(",")}
+    imports_to_add = [name for name in REQUIRED_TYPING_IMPORTS if name not in existing]
 
-    if not (needs_annotated or needs_union or needs_typealias or needs_literal):
+    if not imports_to_add:
         return model_def
 
-    pattern = r"from typing import \((.*?)\)"
-    match = re.search(pattern, model_def, re.DOTALL)
+    old_block = match.group(0)
+    if parenthesized:
+        new_block = old_block.rstrip("\n)").rstrip(",")
+        new_block += ",\n" + ",\n".join(f"    {name}" for name in imports_to_add)
+        new_block += "\n)"
+    else:
+        new_block = old_block.rstrip().rstrip(",") + ", " + ", ".join(imports_to_add)
 
-    if not match:
-        logger.warning("Could not find typing imports")
+    # Splice at the match rather than searching the module again for old_block
+    return model_def[: match.start()] + new_block + model_def[match.end() :]
+
+
+def patch_model_config(model_def: str, configs: list) -> str:
+    """
+    Add settings to the model_config of the given classes, adding a
+    model_config after the class docstring if the class has none.
+
+    Before: model_config = ConfigDict(extra="forbid")
+    After:  model_config = ConfigDict(extra="forbid", key=value)
+
+    Args:
+        model_def: The model definition string
+        configs: List of {for_classes: [...], settings: {key: value}} entries
+    """
+    if not configs:
         return model_def
 
-    imports_to_add = []
-    if needs_annotated:
-        imports_to_add.append("    Annotated")
-    if needs_union:
-        imports_to_add.append("    Union")
-    if needs_typealias:
-        imports_to_add.append("    TypeAlias")
-    if needs_literal:
-        imports_to_add.append("    Literal")
+    logger.info(f"Patching model_config for {len(configs)} class group(s)...")
 
-    old_block = match.group(0)
-    new_block = old_block.rstrip("\n)").rstrip(",")
-    new_block += ",\n" + ",\n".join(imports_to_add) + "\n)"
+    settings_by_class: dict[str, dict] = {}
+    for config in configs:
+        for class_name in config["for_classes"]:
+            settings_by_class.setdefault(class_name, {}).update(config["settings"])
+
+    lines = model_def.split("\n")
+    patched = set()
 
-    model_def = model_def.replace(old_block, new_block, 1)
+    # Work backwards so inserted lines don't shift the blocks still to patch
+    for class_name, start, end in reversed(list(iter_class_blocks(lines))):
+        settings = settings_by_class.get(class_name)
+        if not settings:
+            continue
+
+        args = [f"{key}={value!r}" for key, value in settings.items()]
+        config_line = next(
+            (
+                i
+                for i in range(start, end)
+                if lines[i].lstrip().startswith("model_config = ConfigDict(")
+            ),
+            None,
+        )
+
+        if config_line is None:
+            body_start = class_body_start(lines, start, end)
+            lines.insert(
+                body_start, f"    model_config = ConfigDict({', '.join(args)})"
+            )
+        elif lines[config_line].endswith(")"):
+            # Single line ConfigDict(...)
+            line = lines[config_line]
+            sep = "" if line.endswith("ConfigDict()") else ", "
+            lines[config_line] = f"{line[:-1]}{sep}{', '.join(args)})"
+        else:
+            close = next(
+                j for j in range(config_line + 1, end) if lines[j].strip() == ")"
+            )
+            line = lines[config_line]
+            indent = line[: len(line) - len(line.lstrip())] + "    "
+            lines[close:close] = [f"{indent}{arg}," for arg in args]
+
+        patched.add(class_name)
+        logger.debug(f"    ✓ Patched model_config in class '{class_name}'")
+
+    for class_name in settings_by_class.keys() - patched:
+        logger.warning(f"    ⚠ Warning: Class '{class_name}' not found")
+
+    return "\n".join(lines)
+
+
+def class_body_start(lines: list[str], start: int, end: int) -> int:
+    """
+    Index of the first line after the class docstring in lines[start:end],
+    or start if the class has no docstring.
+    """
+    first = lines[start].strip() if start < end else ""
+    if not first.startswith('"""'):
+        return start
+    if first.count('"""') >= 2:
+        return start + 1
+    for i in range(start + 1, end):
+        if lines[i].rstrip().endswith('"""'):
+            return i + 1
+    return start
+
+
+def remove_model_rebuild_calls(model_def: str) -> str:
+    """
+    Remove the block of Model.model_rebuild() calls at the end of the module.
+    With defer_build each schema is built on first use, with forward
+    references resolved then, so rebuilding every model at import would undo
+    the deferral.
+    """
+    logger.info("Removing model_rebuild() calls...")
+
+    lines = [
+        line
+        for line in model_def.split("\n")
+        if not MODEL_REBUILD_RE.match(line)
+        and not line.startswith(("# Model rebuild", "# see https://pydantic-docs"))
+    ]
+
+    return "\n".join(lines).rstrip("\n") + "\n"
+
+
+def remove_unused_linkml_meta(model_def: str) -> str:
+    """
+    Remove the LinkMLMeta class, which LinkML emits even when generating with
+    --meta None, where nothing refers to it. Its RootModel import is then
+    dropped as unused when tidying with ruff.
+    """
+    lines = model_def.split("\n")
+
+    for class_name, start, end in iter_class_blocks(lines):
+        if class_name != "LinkMLMeta":
+            continue
+
+        remaining = lines[: start - 1] + lines[end:]
+        if any("LinkMLMeta" in line for line in remaining):
+            logger.debug("  - LinkMLMeta is referenced, keeping it")
+            return model_def
+
+        logger.info("Removing unused LinkMLMeta class...")
+        return "\n".join(remaining)
 
     return model_def
 
@@ -404,6 +497,46 @@ def remove_treat_empty_lists_serializer(model_def: str) -> str:
     return "\n".join(new_lines)
 
 
+def strip_field_descriptions(model_def: str) -> str:
+    """
+    Remove the description argument from every Field(...) call.
+
+    Before: width: Optional[int] = Field(default=None, description="The width")
+    After:  width: Optional[int] = Field(default=None)
+
+    Class docstrings are kept. Used for a leaner runtime module, the schema
+    keeps the descriptions.
+    """
+
+    logger.info("Stripping field descriptions...")
+
+    model_def, count = FIELD_DESCRIPTION_RE.subn("", model_def)
+    logger.debug(f"  - Removed {count} field descriptions")
+
+    return model_def
+
+
+def write_atomic(output_path: Path, content: str) -> None:
+    """
+    Write content as UTF-8 bytes to a temporary file next to output_path and
+    move it into place, so a failed run never leaves a half-written module.
+    Bytes are written as-is, with no newline translation.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content.encode("utf-8"))
+        # mkstemp creates the file owner-only, keep the usual permissions
+        mode = output_path.stat().st_mode & 0o777 if output_path.exists() else 0o644
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
 def format_with_ruff(filepath: Path):
     """
     Format a Python file in-place using ruff (formatting + import sorting + unused removal).
@@ -438,12 +571,12 @@ def format_with_ruff(filepath: Path):
         logger.warning("    Continuing with unformatted code")
 
 
-def validate_syntax(output_path: Path) -> bool:
+def validate_syntax(module_content: str) -> bool:
     """
     Check Python syntax by attempting to parse as AST.
     """
     try:
-        ast.parse(output_path.read_text())
+        ast.parse(module_content)
         logger.info("  ✓ Syntax validation passed")
         return True
     except SyntaxError as e:
@@ -456,15 +589,25 @@ def validate_imports(output_path: Path) -> bool:
     """
     Attempt to import the module to catch runtime issues -
     (e.g., undefined names, circular imports, type errors that prevent import).
+    Every model's schema is then built, since with defer_build that would
+    otherwise only happen on first use.
     """
+    spec = importlib.util.spec_from_file_location("patched_models", output_path)
+    module = importlib.util.module_from_spec(spec)
+    # Deferred schema builds resolve forward references through sys.modules
+    sys.modules[spec.name] = module
     try:
-        spec = importlib.util.spec_from_file_location("models", output_path)
-        module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
+        for obj in list(vars(module).values()):
+            if isinstance(obj, type) and obj.__module__ == spec.name:
+                if hasattr(obj, "model_rebuild"):
+                    obj.model_rebuild()
         logger.info("  ✓ Import validation passed")
         return True
     except Exception as e:
         logger.error(f"  ✗ Failed to import patched models: {e}")
+    finally:
+        sys.modules.pop(spec.name, None)
     return False
 
 
@@ -499,9 +642,7 @@ def validate_discriminated_unions(module_content: str) -> bool:
     """
     Verify discriminated unions were applied.
     """
-    discriminator_pattern = r'Field\(discriminator="[^"]+"\)'
-
-    discriminator_matches = re.findall(discriminator_pattern, module_content)
+    discriminator_matches = DISCRIMINATOR_FIELD_RE.findall(module_content)
 
     if len(discriminator_matches) == 0:
         logger.error("  ✗ No discriminated unions found (expected at least one)")
@@ -517,10 +658,7 @@ def validate_literal_types_for_discriminators(module_content: str) -> bool:
     """
     Verify Literal types for discriminator fields exist.
     """
-    literal_pattern = (
-        r"Literal\[TransformationType\.\w+\]|Literal\[AnnotationType\.\w+\]"
-    )
-    literal_matches = re.findall(literal_pattern, module_content)
+    literal_matches = LITERAL_DISCRIMINATOR_RE.findall(module_content)
 
     if len(literal_matches) == 0:
         logger.warning("  ⚠ Warning: No Literal discriminator fields found")
@@ -538,14 +676,14 @@ def validate_patched_models(output_path: Path) -> bool:
     """
     logger.info("Validating patched models...")
 
-    if not validate_syntax(output_path):
+    module_content = output_path.read_bytes().decode("utf-8")
+
+    if not validate_syntax(module_content):
         return False
 
     if not validate_imports(output_path):
         return False
 
-    module_content = output_path.read_text()
-
     if not validate_type_aliases(module_content):
         return False
 
@@ -559,12 +697,17 @@ def validate_patched_models(output_path: Path) -> bool:
     return True
 
 
-def patch_models(input_path: Path, output_path: Path) -> None:
-    model_def = input_path.read_text()
+def patch_models(
+    input_path: Path, output_path: Path, strip_descriptions: bool = False
+) -> None:
+    model_def = input_path.read_bytes().decode("utf-8")
     patch_config = load_patch_config_yaml()
 
     model_def = ensure_typing_imports(model_def)
     model_def = remove_treat_empty_lists_serializer(model_def)
+    model_def = remove_unused_linkml_meta(model_def)
+    if strip_descriptions:
+        model_def = strip_field_descriptions(model_def)
 
     for title, config in patch_config.items():
         if title == "type_aliases":
@@ -572,8 +715,12 @@ def patch_models(input_path: Path, output_path: Path) -> None:
         if title == "discriminated_fields":
             model_def = patch_discriminated_unions(model_def, config)
             model_def = patch_discriminator_fields_to_literal(model_def, config)
+        if title == "model_config":
+            model_def = patch_model_config(model_def, config)
+            if any(c["settings"].get("defer_build") for c in config):
+                model_def = remove_model_rebuild_calls(model_def)
 
-    output_path.write_text(model_def)
+    write_atomic(output_path, model_def)
 
     format_with_ruff(output_path)
 
@@ -595,19 +742,24 @@ def patch_models(input_path: Path, output_path: Path) -> None:
 
 
 def main():
-    if len(sys.argv) < 3:
-        logger.error("Usage: patch_models.py <input_file> <output_file>")
+    args = [arg for arg in sys.argv[1:] if arg != "--strip-descriptions"]
+    strip_descriptions = len(args) < len(sys.argv) - 1
+
+    if len(args) < 2:
+        logger.error(
+            "Usage: patch_models.py <input_file> <output_file> [--strip-descriptions]"
+        )
         logger.error("Example: patch_models.py gen_models.py models.py")
         sys.exit(1)
 
-    input_file = Path(sys.argv[1])
-    output_file = Path(sys.argv[2])
+    input_file = Path(args[0])
+    output_file = Path(args[1])
 
     if not input_file.exists():
         logger.error(f"Input file not found: {input_file}")
         sys.exit(1)
 
-    patch_models(input_file, output_file)
+    patch_models(input_file, output_file, strip_descriptions=strip_descriptions)
 
 
 if __name__ == "__main__":
@@ -3,16 +3,19 @@ from deepdiff import DeepDiff
 import importlib.util
 
 
-def load_module(path):
-    spec = importlib.util.spec_from_file_location("module", path)
+def load_module(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
     module = importlib.util.module_from_spec(spec)
+    # Deferred schema builds resolve forward references through sys.modules,
+    # so each file needs its own registered name
+    sys.modules[name] = module
     spec.loader.exec_module(module)
     return module
 
 
 def compare_models(old_path, new_path, verbose=False):
-    old = load_module(old_path)
-    new = load_module(new_path)
+    old = load_module(old_path, "old_models")
+    new = load_module(new_path, "new_models")
 
     skip_classes = {"ConfiguredBaseModel", "LinkMLMeta", "BaseModel", "RootModel"}
 
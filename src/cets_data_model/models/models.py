@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Annotated, Any, Literal, Optional, TypeAlias, Union
+from typing import Annotated, Literal, Optional, TypeAlias, Union
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
-    RootModel,
 )
 
 # Type aliases
@@ -34,26 +33,11 @@ class ConfiguredBaseModel(BaseModel):
         arbitrary_types_allowed=True,
         use_enum_values=True,
         strict=False,
+        revalidate_instances="never",
+        defer_build=True,
     )
 
 
-class LinkMLMeta(RootModel):
-    root: dict[str, Any] = {}
-    model_config = ConfigDict(frozen=True)
-
-    def __getattr__(self, key: str):
-        return getattr(self.root, key)
-
-    def __getitem__(self, key: str):
-        return self.root[key]
-
-    def __setitem__(self, key: str, value):
-        self.root[key] = value
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.root
-
-
 linkml_meta = None
 
 
@@ -262,6 +246,7 @@ class Axis(ConfiguredBaseModel):
     An axis in a coordinate system
     """
 
+    model_config = ConfigDict(frozen=True)
     name: Optional[str] = Field(
         default=None, description="""A human-readable name or title for this entity"""
     )
@@ -308,6 +293,7 @@ class Identity(CoordinateTransformation):
     The identity transformation
     """
 
+    model_config = ConfigDict(frozen=True)
     transformation_type: Literal[TransformationType.identity] = Field(
         TransformationType.identity, description="""The type of transformation."""
     )
@@ -327,6 +313,7 @@ class AxisNameMapping(ConfiguredBaseModel):
     Axis name to Axis name mapping
     """
 
+    model_config = ConfigDict(frozen=True)
     axis1_name: Optional[str] = Field(
         default=None, description="""The type of transformation"""
     )
@@ -362,6 +349,7 @@ class Translation(CoordinateTransformation):
     A translation transformation
     """
 
+    model_config = ConfigDict(frozen=True)
     translation: Optional[list[float]] = Field(
         default=[], description="""The translation vector"""
     )
@@ -384,6 +372,7 @@ class Scale(CoordinateTransformation):
     A scaling transformation
     """
 
+    model_config = ConfigDict(frozen=True)
     scale: Optional[list[float]] = Field(
         default=[], description="""The scaling vector"""
     )
@@ -406,6 +395,7 @@ class Affine(CoordinateTransformation):
     An affine transformation
     """
 
+    model_config = ConfigDict(frozen=True)
     affine: Optional[Matrix3x3] = Field(
         default=None, description="""The affine matrix"""
     )
@@ -488,6 +478,7 @@ class CTFMetadata(ConfiguredBaseModel):
     A set of CTF patameters for an image.
     """
 
+    model_config = ConfigDict(frozen=True)
     defocus_u: Optional[float] = Field(
         default=None,
         description="""Estimated defocus U for this image in Angstrom, underfocus positive.""",
@@ -1689,63 +1680,3 @@ class Dataset(ConfiguredBaseModel):
     averages: Optional[list[Average]] = Field(
         default=[], description="""The averages in the dataset"""
     )
-
-
-# Model rebuild
-# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model
-Image2D.model_rebuild()
-Image3D.model_rebuild()
-ImageStack2D.model_rebuild()
-ImageStack3D.model_rebuild()
-Axis.model_rebuild()
-CoordinateSystem.model_rebuild()
-CoordinateTransformation.model_rebuild()
-Identity.model_rebuild()
-AxisNameMapping.model_rebuild()
-MapAxis.model_rebuild()
-Translation.model_rebuild()
-Scale.model_rebuild()
-Affine.model_rebuild()
-Sequence.model_rebuild()
-ProjectionAlignment.model_rebuild()
-Alignment.model_rebuild()
-CTFMetadata.model_rebuild()
-AcquisitionMetadataMixin.model_rebuild()
-GainFile.model_rebuild()
-DefectFile.model_rebuild()
-MovieFrame.model_rebuild()
-MovieStack.model_rebuild()
-MovieStackSeries.model_rebuild()
-BaseProjectionImage.model_rebuild()
-ProjectionImage.model_rebuild()
-SubProjectionImage.model_rebuild()
-TiltImage.model_rebuild()
-TiltSeries.model_rebuild()
-Tomogram.model_rebuild()
-ParticleMap.model_rebuild()
-CoordMetaMixin.model_rebuild()
-AssociatedFile.model_rebuild()
-Annotation.model_rebuild()
-SegmentationMask2D.model_rebuild()
-SegmentationMask3D.model_rebuild()
-ProbabilityMap2D.model_rebuild()
-ProbabilityMap3D.model_rebuild()
-PointSet2D.model_rebuild()
-PointSet3D.model_rebuild()
-PointVectorSet2D.model_rebuild()
-PointVectorSet3D.model_rebuild()
-PointMatrixSet2D.model_rebuild()
-PointMatrixSet3D.model_rebuild()
-TriMesh.model_rebuild()
-SphereSet.model_rebuild()
-CircleSet.model_rebuild()
-CylinderSet.model_rebuild()
-CuboidSet.model_rebuild()
-BoxSet.model_rebuild()
-Spline2D.model_rebuild()
-Spline3D.model_rebuild()
-DensityMap.model_rebuild()
-Region.model_rebuild()
-Average.model_rebuild()
-MovieStackCollection.model_rebuild()
-Dataset.model_rebuild()
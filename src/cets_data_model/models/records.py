@@ -0,0 +1,144 @@
+from dataclasses import dataclass, field, fields
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+
+from cets_data_model.models.models import (
+    CoordinateSystem,
+    CTFMetadata,
+    TiltImage,
+    Tomogram,
+)
+
+"""Lightweight record types mirroring the flat CETS models
+
+Slotted dataclasses are much cheaper to create and hold in memory than the
+pydantic models, so they are suited to building or filtering large numbers
+of records. Convert with to_model() at serialization boundaries, where the
+data is validated. TomogramTable holds the tomogram dimensions as columns
+for computing aggregates over many tomograms at once.
+"""
+
+
+def _record_values(record: Any) -> dict[str, Any]:
+    """Shallow field values of a record (dataclasses.asdict deep copies)"""
+    return {f.name: getattr(record, f.name) for f in fields(record)}
+
+
+@dataclass(slots=True)
+class CTFMetadataRecord:
+    """Slotted mirror of CTFMetadata"""
+
+    defocus_u: Optional[float] = None
+    defocus_v: Optional[float] = None
+    defocus_angle: Optional[float] = None
+    phase_shift: Optional[float] = None
+    defocus_handedness: Optional[int] = -1
+
+    @classmethod
+    def from_model(cls, model: CTFMetadata) -> "CTFMetadataRecord":
+        """Create a record from a CTFMetadata model"""
+        return cls(**{f.name: getattr(model, f.name) for f in fields(cls)})
+
+    def to_model(self) -> CTFMetadata:
+        """Validate the record into a CTFMetadata model"""
+        return CTFMetadata.model_validate(_record_values(self))
+
+
+@dataclass(slots=True)
+class TomogramRecord:
+    """Slotted mirror of Tomogram
+
+    Coordinate systems and transformations are held as model instances, they
+    are passed through without being copied when converting to a Tomogram.
+    """
+
+    id: str
+    path: Optional[str] = None
+    ctf_corrected: Optional[bool] = None
+    even_path: Optional[str] = None
+    odd_path: Optional[str] = None
+    tilt_series_id: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    depth: Optional[int] = None
+    coordinate_systems: list[CoordinateSystem] = field(default_factory=list)
+    coordinate_transformations: list[Any] = field(default_factory=list)
+
+    @classmethod
+    def from_model(cls, model: Tomogram) -> "TomogramRecord":
+        """Create a record from a Tomogram model"""
+        return cls(**{f.name: getattr(model, f.name) for f in fields(cls)})
+
+    def to_model(self) -> Tomogram:
+        """Validate the record into a Tomogram model"""
+        return Tomogram.model_validate(_record_values(self))
+
+
+@dataclass(slots=True)
+class TiltImageRecord:
+    """Slotted mirror of TiltImage
+
+    Nested CTF metadata, coordinate systems and transformations are held as
+    model instances and passed through without copying.
+    """
+
+    width: Optional[int] = None
+    height: Optional[int] = None
+    nominal_tilt_angle: Optional[float] = None
+    accumulated_dose: Optional[float] = None
+    ctf_metadata: Optional[CTFMetadata] = None
+    path: Optional[str] = None
+    section: Optional[int] = None
+    movie_stack_id: Optional[str] = None
+    coordinate_systems: list[CoordinateSystem] = field(default_factory=list)
+    coordinate_transformations: list[Any] = field(default_factory=list)
+
+    @classmethod
+    def from_model(cls, model: TiltImage) -> "TiltImageRecord":
+        """Create a record from a TiltImage model"""
+        return cls(**{f.name: getattr(model, f.name) for f in fields(cls)})
+
+    def to_model(self) -> TiltImage:
+        """Validate the record into a TiltImage model"""
+        return TiltImage.model_validate(_record_values(self))
+
+
+@dataclass(slots=True)
+class TomogramTable:
+    """Column-wise view of the sizes of many tomograms
+
+    Dimensions are float arrays so that a missing width, height or depth is
+    NaN and propagates through aggregates.
+    """
+
+    ids: list[str]
+    paths: list[Optional[str]]
+    widths: np.ndarray
+    heights: np.ndarray
+    depths: np.ndarray
+
+    @classmethod
+    def from_tomograms(
+        cls, tomograms: Iterable[Union[Tomogram, TomogramRecord]]
+    ) -> "TomogramTable":
+        """Create a table from Tomogram models or records"""
+        tomograms = list(tomograms)
+
+        def column(name: str) -> np.ndarray:
+            return np.array([getattr(t, name) for t in tomograms], dtype=np.float64)
+
+        return cls(
+            ids=[t.id for t in tomograms],
+            paths=[t.path for t in tomograms],
+            widths=column("width"),
+            heights=column("height"),
+            depths=column("depth"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def volumes(self) -> np.ndarray:
+        """Volume of each tomogram in voxels"""
+        return self.widths * self.heights * self.depths
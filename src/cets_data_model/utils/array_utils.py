@@ -0,0 +1,96 @@
+from typing import Any, Mapping, Optional, TypeVar
+
+import numpy as np
+from numpy.typing import ArrayLike
+from pydantic import BaseModel
+
+"""Helper functions for moving annotation fields to and from numpy arrays"""
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+# Shape of a single item of each list-of-vectors/matrices field
+FIELD_ITEM_SHAPES: dict[str, tuple[int, ...]] = {
+    "origin2D": (2,),
+    "origin3D": (3,),
+    "vector2D": (2,),
+    "vector3D": (3,),
+    "matrix2D": (2, 2),
+    "matrix3D": (3, 3),
+    "dimensions2D": (2,),
+    "dimensions3D": (3,),
+}
+
+
+def field_as_array(
+    model: BaseModel, field_name: str, dtype: np.dtype = np.float64
+) -> Optional[np.ndarray]:
+    """Get a list of vectors or matrices from a model as a single array
+
+    The list is converted in one call, so downstream maths works on a
+    contiguous (N, ...) array rather than nested lists of Python floats.
+
+    Args:
+        model (BaseModel): The model holding the field, e.g. a PointSet3D
+        field_name (str): The name of the field, e.g. "origin3D"
+        dtype (np.dtype): The dtype of the returned array
+
+    Returns:
+        Optional[np.ndarray]: Array of shape (N, *item shape), or None if the
+            field is not set
+
+    Raises:
+        ValueError: If the field is not a list of vectors or matrices
+    """
+    if field_name not in FIELD_ITEM_SHAPES:
+        raise ValueError(f"{field_name} is not a list of vectors or matrices")
+    value = getattr(model, field_name)
+    if value is None:
+        return None
+    return np.asarray(value, dtype=dtype).reshape(-1, *FIELD_ITEM_SHAPES[field_name])
+
+
+def annotation_from_arrays(
+    annotation_cls: type[ModelType], arrays: Mapping[str, ArrayLike], **values: Any
+) -> ModelType:
+    """Create an annotation with its vector or matrix fields given as arrays
+
+    The shape of each array is checked once by numpy, rather than pydantic
+    checking the length of every vector and the type of every float. The
+    other fields are validated as usual.
+
+    Args:
+        annotation_cls (type[ModelType]): The annotation class, e.g. PointSet3D
+        arrays (Mapping[str, ArrayLike]): Arrays by field name, e.g.
+            {"origin3D": points} with points of shape (N, 3)
+        **values: The other field values
+
+    Returns:
+        ModelType: The annotation
+
+    Raises:
+        ValueError: If a field is not a vector or matrix field of the class, or
+            an array does not have shape (N, *item shape) with N >= 1
+        ValidationError: If the other values fail validation
+    """
+    checked = {}
+    for field_name, value in arrays.items():
+        item_shape = FIELD_ITEM_SHAPES.get(field_name)
+        if item_shape is None or field_name not in annotation_cls.model_fields:
+            raise ValueError(
+                f"{field_name} is not a vector or matrix field of "
+                f"{annotation_cls.__name__}"
+            )
+        arr = np.asarray(value, dtype=np.float64)
+        if (
+            arr.ndim != len(item_shape) + 1
+            or arr.shape[1:] != item_shape
+            or not len(arr)
+        ):
+            raise ValueError(
+                f"{field_name} must have shape (N, {', '.join(map(str, item_shape))}),"
+                f" got {arr.shape}"
+            )
+        checked[field_name] = arr.tolist()
+
+    # model_copy does not revalidate the updated fields, which were checked above
+    return annotation_cls.model_validate(values).model_copy(update=checked)
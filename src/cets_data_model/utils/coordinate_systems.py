@@ -24,14 +24,19 @@ Z_AXIS_PHYSICAL = Axis(
     name="physical coordinates z axis", axis_unit="Ångstrom", axis_type=AxisType.space
 )
 
+# Axes of each standard coordinate system, shared by every instance built
+AXES_LOGICAL_2D = (X_AXIS_LOGICAL, Y_AXIS_LOGICAL)
+AXES_LOGICAL_3D = (X_AXIS_LOGICAL, Y_AXIS_LOGICAL, Z_AXIS_LOGICAL)
+AXES_PHYSICAL_2D = (X_AXIS_PHYSICAL, Y_AXIS_PHYSICAL)
+AXES_PHYSICAL_3D = (X_AXIS_PHYSICAL, Y_AXIS_PHYSICAL, Z_AXIS_PHYSICAL)
+
 
 def physical_coords(name: str, dim: int) -> CoordinateSystem:
     """Generate physical coordinates object"""
-    axes = [X_AXIS_PHYSICAL, Y_AXIS_PHYSICAL]
-    name = name
+    axes = AXES_PHYSICAL_2D
     if dim == 3:
-        axes.append(Z_AXIS_PHYSICAL)
-    elif dim not in (2, 3):
+        axes = AXES_PHYSICAL_3D
+    elif dim != 2:
         raise ValueError(f"{dim} is not a valid dimension")
     return CoordinateSystem(name=name, axes=axes)
 
@@ -42,10 +47,10 @@ def logical_coords(name: Optional[str] = None, dim: int = 2) -> CoordinateSystem
     Gives the base logical coordinates if no name specified
     """
     name = "logical coordinates 2d" if name is None else name
-    axes = [X_AXIS_LOGICAL, Y_AXIS_LOGICAL]
+    axes = AXES_LOGICAL_2D
     if dim == 3:
         name = "logical coordinates 3d"
-        axes.append(Z_AXIS_LOGICAL)
-    elif dim not in (2, 3):
+        axes = AXES_LOGICAL_3D
+    elif dim != 2:
         raise ValueError(f"{dim} is not a valid dimension")
     return CoordinateSystem(name=name, axes=axes)
@@ -1,18 +1,21 @@
+import io
 import struct
 
-import mrcfile
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 
 import numpy as np
-from PIL import UnidentifiedImageError, Image
-from typing import Optional, Tuple, Union
+from typing import BinaryIO, Iterable, List, Optional, Tuple, Union
 from warnings import warn
-from pathlib import Path
+
+# mrcfile and PIL are slow to import, so they are only imported by the functions
+# that need them
 
 
 def check_file_is_mrc(file: Union[str, os.PathLike]) -> bool:
-    """Validate that a file is a mrc file
+    """Validate that a file is a mrc file from its map ID
 
     Args:
         file (Union[str, os.PathLike]): The path for the file to check, relative to the project directory
@@ -20,16 +23,14 @@ def check_file_is_mrc(file: Union[str, os.PathLike]) -> bool:
     Returns:
         bool: The file is a valid mrc
     """
-    file = str(file)
     try:
-        mrcfile.open(file, header_only=True)
-        return True
-    except Exception:
+        return _sniff_image_type(os.fspath(file)) == "mrc"
+    except OSError:
         return False
 
 
 def check_file_is_tif(file: Union[str, os.PathLike]) -> bool:
-    """Validate that a file is a tif file
+    """Validate that a file is a tif file from its signature
 
     Args:
         file (Union[str, os.PathLike]): The path for the file to check, relative to
@@ -38,15 +39,10 @@ def check_file_is_tif(file: Union[str, os.PathLike]) -> bool:
     Returns:
         bool: The file is a valid tif
     """
-    file = str(file)
     try:
-        with Image.open(file) as im:
-            imgformat = im.format
-    except (UnidentifiedImageError, OSError):
+        return _sniff_image_type(os.fspath(file)) == "tif"
+    except OSError:
         return False
-    if imgformat == "TIFF":
-        return True
-    return False
 
 
 def check_file_is_em(file: Union[str, os.PathLike]) -> bool:
@@ -58,22 +54,193 @@ def check_file_is_em(file: Union[str, os.PathLike]) -> bool:
     Returns:
         bool: The file is a valid .em
     """
-    file = str(file)
+    file = os.fspath(file)
     return True if file.endswith(".em") else False
 
 
-def get_mrc_dims(in_mrc: Union[str, os.PathLike]) -> Tuple[int, int, int]:
+MRC_HEADER_SIZE = 1024
+MRC_MAP_ID = b"MAP "
+# nx, ny, nz are the first three words of the header
+MRC_DIMS_LE = struct.Struct("<3i")
+MRC_DIMS_BE = struct.Struct(">3i")
+# nx, ny, nz, mode, skipping the start indices, mx, my, mz and the cell lengths
+MRC_INFO_LE = struct.Struct("<4i12x3i3f")
+MRC_INFO_BE = struct.Struct(">4i12x3i3f")
+
+
+def _read_mrc_header(in_mrc: str, buf: bytearray) -> None:
+    """Read the raw header of a mrc file into a preallocated buffer
+
+    Args:
+        in_mrc (str): The name of the file
+        buf (bytearray): Buffer of MRC_HEADER_SIZE bytes to read the header into
+
+    Raises:
+        ValueError: If the file is too short or does not have the mrc map ID
+    """
+    with open(in_mrc, "rb", buffering=0) as f:
+        n_read = f.readinto(buf)
+    if n_read != MRC_HEADER_SIZE:
+        raise ValueError(f"{in_mrc} is too short to be a mrc file")
+    if buf[208:212] != MRC_MAP_ID:
+        raise ValueError(f"{in_mrc} is not a mrc file: map ID string not found")
+
+
+def _unpack_mrc_dims(header: bytearray) -> Tuple[int, int, int]:
+    """Unpack nx, ny, nz from a raw mrc header, using the machine stamp byte order"""
+    # machine stamp 0x11 0x11 is big endian, 0x44 0x44 or 0x44 0x41 little endian
+    dims = MRC_DIMS_BE if header[212] == 0x11 else MRC_DIMS_LE
+    return dims.unpack_from(header, 0)
+
+
+def get_mrc_dims(
+    in_mrc: Union[str, os.PathLike], strict: bool = False
+) -> Tuple[int, int, int]:
     """Get the shape of a mrc file
 
     Args:
         in_mrc (Union[str, os.PathLike]): The name of the file
+        strict (bool): Read the header with mrcfile rather than unpacking the
+            raw bytes directly
     Returns:
         Tuple[int, int, int]: x,y,z size in pixels
 
+    Raises:
+        ValueError: If the file is not a mrc file
     """
-    in_mrc = str(in_mrc)
-    with mrcfile.open(in_mrc, header_only=True) as mrc:
-        return int(mrc.header.nx), int(mrc.header.ny), int(mrc.header.nz)
+    in_mrc = os.fspath(in_mrc)
+    if strict:
+        import mrcfile
+
+        with mrcfile.open(in_mrc, mode="r", header_only=True) as mrc:
+            return int(mrc.header.nx), int(mrc.header.ny), int(mrc.header.nz)
+    # keying on mtime and size means a rewritten file is read again
+    stat = os.stat(in_mrc)
+    return _get_mrc_dims_cached(in_mrc, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4096)
+def _get_mrc_dims_cached(in_mrc: str, mtime_ns: int, size: int) -> Tuple[int, int, int]:
+    """Read the dims from a raw mrc header, cached on the file's stat"""
+    return _read_mrc_dims(in_mrc)
+
+
+def _read_mrc_dims(in_mrc: str) -> Tuple[int, int, int]:
+    """Read the dims from a raw mrc header"""
+    buf = bytearray(MRC_HEADER_SIZE)
+    _read_mrc_header(in_mrc, buf)
+    return _unpack_mrc_dims(buf)
+
+
+def clear_mrc_dims_cache() -> None:
+    """Clear the cache of mrc dims used by get_mrc_dims"""
+    _get_mrc_dims_cached.cache_clear()
+
+
+def _map_threaded(func, items: list, max_workers: int) -> list:
+    """Map a function over items in a thread pool, keeping the input order"""
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as ex:
+        return list(ex.map(func, items))
+
+
+def get_mrc_dims_batch(
+    in_mrcs: Iterable[Union[str, os.PathLike]], max_workers: Optional[int] = None
+) -> List[Tuple[int, int, int]]:
+    """Get the shapes of many mrc files
+
+    Only the first 1024 bytes of each file are read, with one unbuffered read
+    into a shared buffer, so no numpy header is built per file.
+
+    Args:
+        in_mrcs (Iterable[Union[str, os.PathLike]]): The names of the files
+        max_workers (Optional[int]): Read the headers in up to this many threads.
+            Helps on cold or network storage where each read waits on I/O, for
+            files already in the page cache a single thread is faster
+    Returns:
+        List[Tuple[int, int, int]]: x,y,z size in pixels for each file, in order
+
+    Raises:
+        ValueError: If any of the files is not a mrc file
+    """
+    if max_workers is not None and max_workers > 1:
+        return _map_threaded(
+            _read_mrc_dims, [os.fspath(f) for f in in_mrcs], max_workers
+        )
+
+    buf = bytearray(MRC_HEADER_SIZE)
+    dims = []
+    for in_mrc in in_mrcs:
+        _read_mrc_header(os.fspath(in_mrc), buf)
+        dims.append(_unpack_mrc_dims(buf))
+    return dims
+
+
+# XResolution tag of a tif
+TIFF_X_RESOLUTION = 282
+
+
+def _count_tiff_pages(f: BinaryIO) -> int:
+    """Count the pages of an open tif by following its chain of IFDs
+
+    Only the entry count and next offset of each image file directory are read,
+    rather than loading every frame as PIL's n_frames does.
+
+    Args:
+        f (BinaryIO): The tif file, opened in binary mode
+
+    Returns:
+        int: The number of pages
+    """
+    f.seek(0)
+    head = f.read(16)
+    order = "<" if head[:2] == b"II" else ">"
+    if head[2:4] in (b"*\x00", b"\x00*"):
+        count_fmt, entry_size, offset_fmt, first_offset = "H", 12, "I", 4
+    else:
+        # BigTIFF has 8 byte counts and offsets
+        count_fmt, entry_size, offset_fmt, first_offset = "Q", 20, "Q", 8
+    entry_count = struct.Struct(order + count_fmt)
+    next_offset = struct.Struct(order + offset_fmt)
+    offset = next_offset.unpack_from(head, first_offset)[0]
+
+    pages = 0
+    seen = set()
+    while offset and offset not in seen:
+        seen.add(offset)
+        f.seek(offset)
+        count = f.read(entry_count.size)
+        if len(count) != entry_count.size:
+            break
+        pages += 1
+        f.seek(entry_count.unpack(count)[0] * entry_size, os.SEEK_CUR)
+        offset_bytes = f.read(next_offset.size)
+        if len(offset_bytes) != next_offset.size:
+            break
+        offset = next_offset.unpack(offset_bytes)[0]
+    return pages
+
+
+def _read_tiff_header(in_tiff: str) -> Tuple[int, int, int, str, Optional[Tuple]]:
+    """Read the header values of a tif with a single open
+
+    Args:
+        in_tiff (str): Path to the image
+
+    Returns:
+        Tuple[int, int, int, str, Optional[Tuple]]: The width, height, number of
+            frames, mode and dpi
+
+    Raises:
+        UnidentifiedImageError: If the file is not a tif
+    """
+    from PIL import Image
+
+    with open(in_tiff, "rb") as f:
+        with Image.open(f, formats=["TIFF"]) as tif:
+            width, height, mode = tif.width, tif.height, tif.mode
+            # PIL reports a dpi of 1 when the file has no resolution tags
+            dpi = tif.info.get("dpi", None) if TIFF_X_RESOLUTION in tif.tag_v2 else None
+        return width, height, _count_tiff_pages(f), mode, dpi
 
 
 def get_tiff_dims(in_tiff: Union[str, os.PathLike]) -> Tuple[int, int, int]:
@@ -85,9 +252,61 @@ def get_tiff_dims(in_tiff: Union[str, os.PathLike]) -> Tuple[int, int, int]:
         Tuple[int, int, int]: x,y,z size in pixels
 
     """
-    in_tiff = str(in_tiff)
-    with Image.open(str(in_tiff)) as tif:
-        return tif.width, tif.height, tif.n_frames
+    return _read_tiff_header(os.fspath(in_tiff))[:3]
+
+
+def _probe_tif(in_img: str) -> Optional[Tuple[int, int, int, str, Optional[Tuple]]]:
+    """Read the header values of a tif, or None if the file is not a tif
+
+    Args:
+        in_img (str): Path to the image
+
+    Returns:
+        Optional[Tuple[int, int, int, str, Optional[Tuple]]]: The width, height,
+            number of frames, mode and dpi, or None if the file is not a tif
+    """
+    from PIL import UnidentifiedImageError
+
+    try:
+        return _read_tiff_header(in_img)
+    except (UnidentifiedImageError, OSError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _probe_tif_cached(
+    in_img: str, mtime_ns: int, size: int
+) -> Optional[Tuple[int, int, int, str, Optional[Tuple]]]:
+    """Read the header values of a tif, cached on the file's stat"""
+    return _probe_tif(in_img)
+
+
+# Little and big endian signatures of classic and BigTIFF files
+TIFF_SIGNATURES = (b"II*\x00", b"MM\x00*", b"II+\x00", b"MM\x00+")
+
+
+def _sniff_image_type(in_img: str) -> str:
+    """Identify an image as mrc or tif from the first bytes of the file
+
+    Args:
+        in_img (str): Path to the image
+
+    Returns:
+        str: "mrc", "tif" or "unknown"
+    """
+    with open(in_img, "rb", buffering=0) as f:
+        start = f.read(MRC_HEADER_SIZE)
+    if start[208:212] == MRC_MAP_ID:
+        return "mrc"
+    if start[:4] in TIFF_SIGNATURES:
+        return "tif"
+    return "unknown"
+
+
+@lru_cache(maxsize=65536)
+def _get_image_type_cached(in_img: str, mtime_ns: int, size: int) -> str:
+    """Identify an image from its first bytes, cached on the file's stat"""
+    return _sniff_image_type(in_img)
 
 
 def get_image_dims(in_img: Union[str, os.PathLike]) -> Tuple[int, int, int]:
@@ -99,18 +318,22 @@ def get_image_dims(in_img: Union[str, os.PathLike]) -> Tuple[int, int, int]:
     Returns:
         Tuple[int, int, int]: x,y,z size in pixels
     """
-    in_img = str(in_img)
-    if not Path(in_img).is_file():
+    in_img = os.fspath(in_img)
+    if not os.path.isfile(in_img):
         raise ValueError(f"File not found: {in_img}")
-    if check_file_is_mrc(in_img):
+    stat = os.stat(in_img)
+    img_type = _get_image_type_cached(in_img, stat.st_mtime_ns, stat.st_size)
+    if img_type == "mrc":
         return get_mrc_dims(in_img)
-    elif check_file_is_tif(in_img):
-        return get_tiff_dims(in_img)
-    else:
+    tif_values = None
+    if img_type == "tif":
+        tif_values = _probe_tif_cached(in_img, stat.st_mtime_ns, stat.st_size)
+    if tif_values is None:
         raise ValueError(f"{in_img} is not a valid mrc or tif file")
+    return tif_values[:3]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImageInfo:
     """Info about an image the doesn't require reading the image into memory to get"""
 
@@ -133,44 +356,52 @@ def get_tiff_info(in_tiff: Union[str, os.PathLike]) -> ImageInfo:
     Returns:
         ImageInfo: The requested info
     """
-    in_tiff = str(in_tiff)
-    tiff_modes = {
-        "1": "1-bit pixels, black and white, stored with one pixel per byte",
-        "L": "8-bit unsigned pixels, grayscale",
-        "P": "8-bit unsigned pixels, grayscale, mapped to any other mode using a color"
-        " palette",
-        "RGB": "3x8-bit pixels, true color",
-        "RGBA": "4x8-bit pixels, true color with transparency mask",
-        "CMYK": "4x8-bit pixels, color separation",
-        "YCbCr": "3x8-bit pixels, color video format",
-        "LAB": "3x8-bit pixels, the L*a*b color space",
-        "HSV": "3x8-bit pixels, Hue, Saturation, Value color space",
-        "I": "32-bit signed integer pixels",
-        "F": "32-bit floating point pixels",
-        "LA": "8-bit unsigned pixels, grayscale with alpha",
-        "PA": "8-bit unsigned pixels, grayscale mapped to palette with alpha",
-        "RGBX": "true color with padding",
-        "RGBa": "true color with premultiplied alpha",
-        "La": "8-bit unsigned pixels, grayscale with premultiplied alpha",
-        "I;16": "16-bit unsigned integer pixels",
-        "I;16L": "16-bit little endian unsigned integer pixels",
-        "I;16B": "16-bit big endian unsigned integer pixels",
-        "I;16N": "16-bit native endian unsigned integer pixels",
-    }
-
-    x_size, y_size, z_size = get_tiff_dims(in_tiff)
-    with Image.open(in_tiff) as tif:
-        # Calculate voxel size from resolution tags
-        dpi = tif.info.get("dpi", None)
-        if dpi is not None:
-            # assume voxels are cubic
-            apix = dpi[0] / 2.54e-8
-        else:
-            apix = None
+    return _tiff_info(*_read_tiff_header(os.fspath(in_tiff)))
+
+
+ANGSTROMS_PER_INCH = 2.54e8
+# Resolutions written by image software when the pixel size is unknown
+TIFF_PLACEHOLDER_DPIS = {(1, 1), (72, 72), (96, 96)}
+
+# PIL image mode -> description
+TIFF_MODES = {
+    "1": "1-bit pixels, black and white, stored with one pixel per byte",
+    "L": "8-bit unsigned pixels, grayscale",
+    "P": "8-bit unsigned pixels, grayscale, mapped to any other mode using a color"
+    " palette",
+    "RGB": "3x8-bit pixels, true color",
+    "RGBA": "4x8-bit pixels, true color with transparency mask",
+    "CMYK": "4x8-bit pixels, color separation",
+    "YCbCr": "3x8-bit pixels, color video format",
+    "LAB": "3x8-bit pixels, the L*a*b color space",
+    "HSV": "3x8-bit pixels, Hue, Saturation, Value color space",
+    "I": "32-bit signed integer pixels",
+    "F": "32-bit floating point pixels",
+    "LA": "8-bit unsigned pixels, grayscale with alpha",
+    "PA": "8-bit unsigned pixels, grayscale mapped to palette with alpha",
+    "RGBX": "true color with padding",
+    "RGBa": "true color with premultiplied alpha",
+    "La": "8-bit unsigned pixels, grayscale with premultiplied alpha",
+    "I;16": "16-bit unsigned integer pixels",
+    "I;16L": "16-bit little endian unsigned integer pixels",
+    "I;16B": "16-bit big endian unsigned integer pixels",
+    "I;16N": "16-bit native endian unsigned integer pixels",
+}
+
+
+def _tiff_info(
+    x_size: int, y_size: int, z_size: int, mode: str, dpi: Optional[Tuple]
+) -> ImageInfo:
+    """Make the ImageInfo for a tif from the values read from its header"""
+    # Calculate voxel size from resolution tags
+    if dpi is not None and tuple(dpi) not in TIFF_PLACEHOLDER_DPIS and dpi[0] > 0:
+        # assume voxels are cubic
+        apix = ANGSTROMS_PER_INCH / dpi[0]
+    else:
+        apix = None
 
-        # get the mode and data type
-        mode = tif.mode
-        mode_desc = tiff_modes.get(mode, "Cannot determine TIFF mode")
+    # get the mode and data type
+    mode_desc = TIFF_MODES.get(mode, "Cannot determine TIFF mode")
 
     return ImageInfo(
         size_x=x_size,
@@ -184,42 +415,146 @@ def get_tiff_info(in_tiff: Union[str, os.PathLike]) -> ImageInfo:
     )
 
 
-def get_mrc_info(in_mrc: Union[str, os.PathLike]) -> ImageInfo:
+def get_mrc_info(
+    in_mrc: Union[str, os.PathLike], validate: bool = False, strict: bool = False
+) -> ImageInfo:
     """Get statistics on a mrc file
 
+    Only the header is read unless validation is requested, validating a file
+    reads all of its data.
+
     Args:
         in_mrc (Union[str, os.PathLike]): The name of the file
+        validate (bool): Validate the whole file against the MRC2014 format and
+            warn if any errors are found, see validate_mrc
+        strict (bool): Read the header with mrcfile rather than unpacking the
+            raw bytes directly
 
     Returns:
         ImageInfo: The requested info
+
+    Raises:
+        ValueError: If the file is not a mrc file
     """
-    in_mrc = str(in_mrc)
-    modes = {
-        "0": "8-bit signed integer (range -128 to 127)",
-        "1": "16-bit signed integer",
-        "2": "32-bit signed real",
-        "3": "transform : complex 16-bit integers",
-        "4": "transform : complex 32-bit reals",
-        "6": "16-bit unsigned integer",
-        "12": "16-bit float (IEEE754)",
-    }
-
-    with mrcfile.mmap(in_mrc) as mrc:
-        if not mrc.validate():
-            warn(f"Validation errors were encountered reading {in_mrc}")
-        head = mrc.header
-        mode = str(head.mode)
-        mode_desc = modes.get(mode, f"Unknown mode (data type): {mode}")
-        return ImageInfo(
-            size_x=int(head.nx),
-            size_y=int(head.ny),
-            size_z=int(head.nz),
-            mode=str(mode),
-            mode_desc=mode_desc,
-            apix_x=head.cella.x / head.mx,
-            apix_y=head.cella.y / head.my,
-            apix_z=None if head.nz == 1 else head.cella.x / head.mx,  # assume cubic
-        )
+    in_mrc = os.fspath(in_mrc)
+    if validate:
+        errors = validate_mrc(in_mrc)
+        if errors:
+            warn(
+                f"Validation errors were encountered reading {in_mrc}: "
+                + "; ".join(errors)
+            )
+    if strict:
+        import mrcfile
+
+        with mrcfile.open(in_mrc, mode="r", header_only=True) as mrc:
+            return _mrc_info_from_header(mrc.header)
+    buf = bytearray(MRC_HEADER_SIZE)
+    _read_mrc_header(in_mrc, buf)
+    info = MRC_INFO_BE if buf[212] == 0x11 else MRC_INFO_LE
+    return _mrc_info(*info.unpack_from(buf, 0))
+
+
+def validate_mrc(in_mrc: Union[str, os.PathLike]) -> List[str]:
+    """Validate a mrc file against the MRC2014 format
+
+    The data is memory mapped and read in full to check the header statistics,
+    so this is expensive for large files.
+
+    Args:
+        in_mrc (Union[str, os.PathLike]): The name of the file
+
+    Returns:
+        List[str]: The validation errors, empty if the file is valid
+    """
+    import mrcfile
+
+    messages = io.StringIO()
+    with mrcfile.mmap(os.fspath(in_mrc), mode="r", permissive=True) as mrc:
+        if mrc.validate(print_file=messages):
+            return []
+    return messages.getvalue().splitlines()
+
+
+# MRC mode -> description of the data type
+MRC_MODES = {
+    "0": "8-bit signed integer (range -128 to 127)",
+    "1": "16-bit signed integer",
+    "2": "32-bit signed real",
+    "3": "transform : complex 16-bit integers",
+    "4": "transform : complex 32-bit reals",
+    "6": "16-bit unsigned integer",
+    "12": "16-bit float (IEEE754)",
+}
+
+
+def _mrc_info_from_header(head: np.recarray) -> ImageInfo:
+    """Make the ImageInfo for a mrc from its mrcfile header"""
+    return _mrc_info(
+        int(head.nx),
+        int(head.ny),
+        int(head.nz),
+        int(head.mode),
+        int(head.mx),
+        int(head.my),
+        int(head.mz),
+        float(head.cella.x),
+        float(head.cella.y),
+        float(head.cella.z),
+    )
+
+
+def _mrc_info(
+    nx: int,
+    ny: int,
+    nz: int,
+    mode: int,
+    mx: int,
+    my: int,
+    mz: int,
+    cell_x: float,
+    cell_y: float,
+    cell_z: float,
+) -> ImageInfo:
+    """Make the ImageInfo for a mrc from the values in its header"""
+    mode = str(mode)
+    mode_desc = MRC_MODES.get(mode, f"Unknown mode (data type): {mode}")
+    apix_x = _mrc_apix(cell_x, mx)
+    if nz == 1:
+        apix_z = None
+    elif mz > 1:
+        apix_z = _mrc_apix(cell_z, mz)
+    else:
+        # image stacks are not sampled along z, assume cubic
+        apix_z = apix_x
+    return ImageInfo(
+        size_x=nx,
+        size_y=ny,
+        size_z=nz,
+        mode=mode,
+        mode_desc=mode_desc,
+        apix_x=apix_x,
+        apix_y=_mrc_apix(cell_y, my),
+        apix_z=apix_z,
+    )
+
+
+def _mrc_apix(cell_length: float, sampling: int) -> Optional[float]:
+    """Pixel size along one axis of a mrc, None if the header has no sampling"""
+    return cell_length / sampling if sampling > 0 else None
+
+
+# Byte 3 is the data type, bytes 4-16 the x, y, z dimensions and bytes 40-52
+# the physical dimensions, the rest of the 512 byte header is not needed
+EM_HEADER = struct.Struct("<3xB3i24x3i")
+# Data type code -> dtype of the data
+EM_DTYPES = {
+    1: np.int8,
+    2: np.int16,
+    4: np.int32,
+    5: np.float32,
+    8: np.complex64,
+}
 
 
 def get_em_file_info(in_em_file: Union[str, os.PathLike]) -> ImageInfo:
@@ -233,58 +568,46 @@ def get_em_file_info(in_em_file: Union[str, os.PathLike]) -> ImageInfo:
         ImageInfo: The requested info
     """
     try:
-        with open(in_em_file, "rb") as f:
-            # Read the header (512 bytes)
-            header_binary = f.read(512)
-
-            # Byte 3: Data type
-            data_type_code = header_binary[3]
-
-            # Bytes 4-16: Dimensions X, Y, Z (integers of 4 bytes)
-            nx, ny, nz = struct.unpack("<3i", header_binary[4:16])
-
-            # Bytes 40, 44, and 48: physical dimensions (integers of 4 bytes)
-            phys_x, phys_y, phys_z = struct.unpack("<3i", header_binary[40:52])
-
-            # Sampling rate calculation:
-            if phys_x > 0 and nx > 0:
-                apix_x = phys_x / nx
-                apix_y = phys_y / ny
-                apix_z = phys_z / nz
-            else:
-                # Not stored in the header
-                apix_x, apix_y, apix_z = (None, None, None)
-
-            # Get the dtype
-            dtype = np.float32
-            if data_type_code == 1:
-                dtype = np.int8
-            elif data_type_code == 2:
-                dtype = np.int16
-            elif data_type_code == 4:
-                dtype = np.int32
-            elif data_type_code == 5:
-                dtype = np.float32
-            elif data_type_code == 8:
-                dtype = np.complex64
-
-            return ImageInfo(
-                size_x=nx,
-                size_y=ny,
-                size_z=nz,
-                mode=str(data_type_code),
-                mode_desc=str(dtype),
-                apix_x=apix_x,
-                apix_y=apix_y,
-                apix_z=apix_z,
-            )
+        buf = bytearray(EM_HEADER.size)
+        with open(in_em_file, "rb", buffering=0) as f:
+            n_read = f.readinto(buf)
+        if n_read != EM_HEADER.size:
+            raise ValueError("file is too short for an em header")
+        data_type_code, nx, ny, nz, phys_x, phys_y, phys_z = EM_HEADER.unpack_from(
+            buf, 0
+        )
+
+        # Sampling rate calculation:
+        if phys_x > 0 and nx > 0:
+            apix_x = phys_x / nx
+            apix_y = phys_y / ny
+            apix_z = phys_z / nz
+        else:
+            # Not stored in the header
+            apix_x, apix_y, apix_z = (None, None, None)
+
+        dtype = EM_DTYPES.get(data_type_code, np.float32)
+        return ImageInfo(
+            size_x=nx,
+            size_y=ny,
+            size_z=nz,
+            mode=str(data_type_code),
+            mode_desc=str(dtype),
+            apix_x=apix_x,
+            apix_y=apix_y,
+            apix_z=apix_z,
+        )
     except Exception as e:
         raise Exception(f"Error reading file {in_em_file}: {e}")
 
 
-def get_em_info(img_name: Union[str, os.PathLike]) -> ImageInfo:
+def get_image_info(img_name: Union[str, os.PathLike]) -> ImageInfo:
     """Get info about a mrc, em or tiff image
 
+    The type of the file is identified from its first bytes so only the reader
+    for that type opens it. Results are cached on the file's mtime and size,
+    so a repeat query costs a stat and a rewritten file is read again.
+
     Args:
         img_name (Union[str, os.PathLike]): Path to the image file
 
@@ -294,13 +617,79 @@ def get_em_info(img_name: Union[str, os.PathLike]) -> ImageInfo:
     Raises:
         ValueError: If the image is not a valid mrc or tiff
     """
-    if not os.path.exists(img_name):
-        raise FileNotFoundError(f"File {img_name} does not exist.")
-    if check_file_is_mrc(img_name):
+    img_name = os.fspath(img_name)
+    try:
+        stat = os.stat(img_name)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File {img_name} does not exist.") from None
+    return _get_image_info_cached(img_name, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4096)
+def _get_image_info_cached(img_name: str, mtime_ns: int, size: int) -> ImageInfo:
+    """Get info about a mrc, em or tiff image, cached on the file's stat"""
+    img_type = _get_image_type_cached(img_name, mtime_ns, size)
+    if img_type == "mrc":
         return get_mrc_info(img_name)
-    elif check_file_is_tif(img_name):
-        return get_tiff_info(img_name)
+    tif_values = None
+    if img_type == "tif":
+        tif_values = _probe_tif_cached(img_name, mtime_ns, size)
+    if tif_values is not None:
+        return _tiff_info(*tif_values)
     elif check_file_is_em(img_name):
         return get_em_file_info(img_name)
     else:
         raise ValueError(f"{img_name} is not a valid mrc, tif or em file.")
+
+
+def clear_image_info_cache() -> None:
+    """Clear the image caches used by get_image_info and get_image_dims"""
+    _get_image_type_cached.cache_clear()
+    _probe_tif_cached.cache_clear()
+    _get_image_info_cached.cache_clear()
+
+
+# Previous name of get_image_info
+get_em_info = get_image_info
+
+
+def get_image_info_batch(
+    img_names: Iterable[Union[str, os.PathLike]], max_workers: Optional[int] = None
+) -> List[ImageInfo]:
+    """Get info about many mrc, em or tiff images
+
+    Args:
+        img_names (Iterable[Union[str, os.PathLike]]): Paths to the image files
+        max_workers (Optional[int]): Read the images in up to this many threads.
+            Helps on cold or network storage where each read waits on I/O, for
+            files already in the page cache a single thread is faster
+    Returns:
+        List[ImageInfo]: Info about each image, in order
+
+    Raises:
+        ValueError: If any image is not a valid mrc, tif or em file
+    """
+    if max_workers is not None and max_workers > 1:
+        return _map_threaded(get_image_info, list(img_names), max_workers)
+    return [get_image_info(img_name) for img_name in img_names]
+
+
+def get_image_dims_batch(
+    in_imgs: Iterable[Union[str, os.PathLike]], max_workers: Optional[int] = None
+) -> List[Tuple[int, int, int]]:
+    """Get dimensions of many images that might be tiff or mrc
+
+    Args:
+        in_imgs (Iterable[Union[str, os.PathLike]]): Paths to the images
+        max_workers (Optional[int]): Read the images in up to this many threads.
+            Helps on cold or network storage where each read waits on I/O, for
+            files already in the page cache a single thread is faster
+    Returns:
+        List[Tuple[int, int, int]]: x,y,z size in pixels for each image, in order
+
+    Raises:
+        ValueError: If any image is not a valid mrc or tif file
+    """
+    if max_workers is not None and max_workers > 1:
+        return _map_threaded(get_image_dims, list(in_imgs), max_workers)
+    return [get_image_dims(in_img) for in_img in in_imgs]
@@ -0,0 +1,214 @@
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional, TypeVar, Union, get_args
+
+from pydantic import BaseModel, TypeAdapter
+
+from cets_data_model.models.models import (
+    Annotation,
+    CoordinateTransformation,
+    Dataset,
+    Region,
+    Tomogram,
+)
+
+"""Helper functions for loading CETS models"""
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+def _list_item_type(model: type[BaseModel], field_name: str) -> Any:
+    """The item type of an Optional[list[...]] field"""
+    list_type = next(
+        arg
+        for arg in get_args(model.model_fields[field_name].annotation)
+        if arg is not type(None)
+    )
+    return get_args(list_type)[0]
+
+
+def _tag_table(union: Any, discriminator: str) -> dict[str, type[BaseModel]]:
+    """Map each discriminator value of an Annotated[Union[...]] to its class"""
+    members = get_args(get_args(union)[0])
+    return {cls.model_fields[discriminator].default.value: cls for cls in members}
+
+
+# The discriminated unions as generated, taken from fields that use them
+ANNOTATION_UNION = _list_item_type(Region, "annotations")
+TRANSFORMATION_UNION = _list_item_type(Tomogram, "coordinate_transformations")
+
+# Discriminator value -> model class, e.g. "point_set_3D" -> PointSet3D
+ANNOTATION_CLASSES: dict[str, type[Annotation]] = _tag_table(
+    ANNOTATION_UNION, "annotation_type"
+)
+TRANSFORMATION_CLASSES: dict[str, type[CoordinateTransformation]] = _tag_table(
+    TRANSFORMATION_UNION, "transformation_type"
+)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: type[ModelType]) -> TypeAdapter[list[ModelType]]:
+    """Get a TypeAdapter for a list of models, built once per model class
+
+    Args:
+        model (type[ModelType]): The model class for the list items
+
+    Returns:
+        TypeAdapter[list[ModelType]]: The cached adapter
+    """
+    return TypeAdapter(list[model])
+
+
+@lru_cache(maxsize=None)
+def dataset_adapter() -> TypeAdapter[Dataset]:
+    """Get the TypeAdapter for a Dataset, built once"""
+    return TypeAdapter(Dataset)
+
+
+@lru_cache(maxsize=None)
+def annotation_adapter() -> TypeAdapter:
+    """Get the TypeAdapter for a single annotation of any type, built once"""
+    return TypeAdapter(ANNOTATION_UNION)
+
+
+@lru_cache(maxsize=None)
+def transformation_adapter() -> TypeAdapter:
+    """Get the TypeAdapter for a single transformation of any type, built once"""
+    return TypeAdapter(TRANSFORMATION_UNION)
+
+
+def parse_annotation(data: Mapping[str, Any]) -> Annotation:
+    """Validate an annotation dict into the class given by its annotation_type
+
+    Args:
+        data (Mapping[str, Any]): The annotation's field values
+
+    Returns:
+        Annotation: The validated annotation, e.g. a PointSet3D
+
+    Raises:
+        ValidationError: If the annotation_type is unknown or the data is invalid
+    """
+    return annotation_adapter().validate_python(data)
+
+
+def parse_transformation(data: Mapping[str, Any]) -> CoordinateTransformation:
+    """Validate a transformation dict into the class given by its
+    transformation_type
+
+    Args:
+        data (Mapping[str, Any]): The transformation's field values
+
+    Returns:
+        CoordinateTransformation: The validated transformation, e.g. an Affine
+
+    Raises:
+        ValidationError: If the transformation_type is unknown or the data is
+            invalid
+    """
+    return transformation_adapter().validate_python(data)
+
+
+def load_models_json(
+    model: type[ModelType], data: Union[str, bytes]
+) -> list[ModelType]:
+    """Validate a JSON array of objects into a list of models
+
+    The JSON is parsed and validated in one pass by pydantic-core, rather than
+    going through json.loads and validating each item separately.
+
+    Args:
+        model (type[ModelType]): The model class for the list items
+        data (Union[str, bytes]): A JSON array of objects
+
+    Returns:
+        list[ModelType]: The validated models
+
+    Raises:
+        ValidationError: If the JSON is invalid or any item fails validation
+    """
+    return list_adapter(model).validate_json(data)
+
+
+def validate_rows(
+    model: type[ModelType], rows: Iterable[Mapping[str, Any]]
+) -> list[ModelType]:
+    """Validate many dicts, e.g. table rows, into a list of models
+
+    The loop over the rows runs inside pydantic-core rather than calling the
+    model once per row from Python.
+
+    Args:
+        model (type[ModelType]): The model class for the rows
+        rows (Iterable[Mapping[str, Any]]): The field values for each model
+
+    Returns:
+        list[ModelType]: The validated models, in order
+
+    Raises:
+        ValidationError: If any row fails validation
+    """
+    return list_adapter(model).validate_python(rows)
+
+
+def read_dataset(json_file: Union[str, os.PathLike]) -> Dataset:
+    """Read and validate a Dataset from a JSON file
+
+    The raw bytes are handed straight to pydantic-core, which parses and
+    validates them in one pass without building intermediate Python dicts.
+
+    Args:
+        json_file (Union[str, os.PathLike]): Path to the JSON file
+
+    Returns:
+        Dataset: The validated dataset
+
+    Raises:
+        ValidationError: If the JSON is invalid or does not match the model
+    """
+    return dataset_from_json(Path(json_file).read_bytes())
+
+
+def dataset_to_json(dataset: Dataset, indent: Optional[int] = None) -> bytes:
+    """Serialize a Dataset to JSON bytes
+
+    pydantic-core writes the JSON directly, without building the intermediate
+    dicts that model_dump() followed by json.dumps() would.
+
+    Args:
+        dataset (Dataset): The dataset to serialize
+        indent (Optional[int]): Indentation for pretty printing, compact if None
+
+    Returns:
+        bytes: The UTF-8 encoded JSON
+    """
+    return dataset_adapter().dump_json(dataset, indent=indent)
+
+
+def dataset_from_json(data: Union[str, bytes]) -> Dataset:
+    """Validate a Dataset from JSON
+
+    Args:
+        data (Union[str, bytes]): The JSON document
+
+    Returns:
+        Dataset: The validated dataset
+
+    Raises:
+        ValidationError: If the JSON is invalid or does not match the model
+    """
+    return dataset_adapter().validate_json(data)
+
+
+def write_dataset(
+    dataset: Dataset, json_file: Union[str, os.PathLike], indent: Optional[int] = None
+) -> None:
+    """Write a Dataset to a JSON file
+
+    Args:
+        dataset (Dataset): The dataset to write
+        json_file (Union[str, os.PathLike]): Path to the JSON file
+        indent (Optional[int]): Indentation for pretty printing, compact if None
+    """
+    Path(json_file).write_bytes(dataset_to_json(dataset, indent=indent))
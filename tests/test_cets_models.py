@@ -1,5 +1,7 @@
 import json
+import numpy as np
 import pytest
+from dataclasses import fields
 from pathlib import Path
 from pydantic import ValidationError
 
@@ -15,6 +17,14 @@ from cets_data_model.models.models import (
     Affine,
     Sequence,
     PointSet3D,
+    CTFMetadata,
+    TiltImage,
+)
+from cets_data_model.models.records import (
+    CTFMetadataRecord,
+    TiltImageRecord,
+    TomogramRecord,
+    TomogramTable,
 )
 
 
@@ -139,6 +149,16 @@ class TestRoundTripSerialization:
         # Should be identical
         assert original.model_dump() == reconstructed.model_dump()
 
+    def test_nested_instances_not_copied(self):
+        """Nested model instances should be kept, not revalidated into copies"""
+        coords = CoordinateSystem(
+            name="physical",
+            axes=[Axis(name="x", axis_unit="angstrom", axis_type="space")],
+        )
+        tomogram = Tomogram(id="tomo_test", coordinate_systems=[coords])
+
+        assert tomogram.coordinate_systems[0] is coords
+
     def test_annotation_roundtrip(self):
         """Annotations should survive round-trip with all fields"""
         original = PointSet3D(
@@ -256,6 +276,25 @@ class TestConstraintValidation:
                 ],
             )
 
+    @pytest.mark.parametrize(
+        "value_object, field_name",
+        [
+            (Axis(name="x", axis_unit="angstrom", axis_type="space"), "name"),
+            (CTFMetadata(defocus_u=1.5), "defocus_u"),
+            (Translation(translation=[1.0, 2.0, 3.0]), "name"),
+            (Scale(scale=[2.0, 2.0, 2.0]), "scale"),
+        ],
+    )
+    def test_value_objects_are_frozen(self, value_object, field_name):
+        """Leaf value objects are frozen, so shared instances can't be changed"""
+        with pytest.raises(ValidationError, match="frozen"):
+            setattr(value_object, field_name, None)
+
+    def test_containers_are_not_frozen(self):
+        tomogram = Tomogram(id="tomo_test")
+        tomogram.width = 512
+        assert tomogram.width == 512
+
     def test_vector_list_length_constraints(self):
         """Point sets must have at least one point"""
         with pytest.raises(ValidationError):
@@ -267,3 +306,67 @@ class TestConstraintValidation:
         # Should work with one point
         ps = PointSet3D(annotation_type="point_set_3D", origin3D=[[1.0, 2.0, 3.0]])
         assert len(ps.origin3D) == 1
+
+
+# ============================================================================
+# 4. RECORD TYPES
+# ============================================================================
+
+
+class TestRecords:
+    """Test that the slotted record types stay in step with the models"""
+
+    @pytest.mark.parametrize(
+        "record_cls, model_cls",
+        [
+            (CTFMetadataRecord, CTFMetadata),
+            (TiltImageRecord, TiltImage),
+            (TomogramRecord, Tomogram),
+        ],
+    )
+    def test_record_fields_match_model(self, record_cls, model_cls):
+        record_fields = {f.name for f in fields(record_cls)}
+        assert record_fields == set(model_cls.model_fields)
+
+    def test_tomogram_record_roundtrip(self):
+        original = Tomogram(
+            id="tomo_test",
+            path="/data/tomo.mrc",
+            width=512,
+            height=512,
+            depth=256,
+            coordinate_transformations=[Scale(scale=[2.0, 2.0, 2.0])],
+        )
+        record = TomogramRecord.from_model(original)
+        assert record.depth == 256
+
+        assert record.to_model() == original
+
+    def test_tilt_image_record_roundtrip(self):
+        original = TiltImage(
+            path="/data/ts_01.mrc",
+            section=3,
+            nominal_tilt_angle=-57.0,
+            ctf_metadata=CTFMetadata(defocus_u=2.5, defocus_v=2.4),
+        )
+        record = TiltImageRecord.from_model(original)
+        assert record.ctf_metadata is original.ctf_metadata
+
+        assert record.to_model() == original
+
+    def test_record_to_model_validates(self):
+        with pytest.raises(ValidationError):
+            CTFMetadataRecord(defocus_u="not_a_number").to_model()
+
+    def test_tomogram_table_volumes(self):
+        table = TomogramTable.from_tomograms(
+            [
+                Tomogram(id="tomo_1", width=10, height=20, depth=5),
+                TomogramRecord(id="tomo_2", width=4, height=4, depth=4),
+                Tomogram(id="tomo_3", width=10, height=20),
+            ]
+        )
+
+        assert len(table) == 3
+        assert table.ids == ["tomo_1", "tomo_2", "tomo_3"]
+        np.testing.assert_array_equal(table.volumes(), [1000.0, 64.0, np.nan])
@@ -3,10 +3,23 @@ import importlib.util
 import pytest
 import re
 import subprocess
+import sys
 from pathlib import Path
 from pydantic import ValidationError
 
 
+def load_models_module(models_path):
+    """
+    Import models.py from its path. The module is registered in sys.modules,
+    as deferred schema builds resolve forward references through it.
+    """
+    spec = importlib.util.spec_from_file_location("models", models_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
 @pytest.fixture
 def models_path():
     """Path to models file."""
@@ -38,11 +51,8 @@ def test_models_can_be_imported(models_path):
     Catches undefined names, circular imports, etc.
     """
 
-    spec = importlib.util.spec_from_file_location("models", models_path)
-    module = importlib.util.module_from_spec(spec)
-
     try:
-        spec.loader.exec_module(module)
+        load_models_module(models_path)
     except Exception as e:
         pytest.fail(f"Failed to import models.py: {e}")
 
@@ -123,9 +133,7 @@ def test_key_classes_exist(models_path):
     Verify that key model classes exist after patching.
     Spot-check some classes from different schema files.
     """
-    spec = importlib.util.spec_from_file_location("models", models_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    module = load_models_module(models_path)
 
     # TODO: add more or full list once models finalised
     expected_classes = [
@@ -151,15 +159,37 @@ def test_key_classes_exist(models_path):
         )
 
 
+def test_models_build_once(models_path):
+    """
+    Verify every model's deferred schema can be built, and that once built
+    a further model_rebuild() call is a no-op rather than a fresh build.
+    """
+    module = load_models_module(models_path)
+
+    base_model = module.ConfiguredBaseModel
+    model_classes = [
+        cls
+        for cls in vars(module).values()
+        if isinstance(cls, type)
+        and issubclass(cls, base_model)
+        and cls.__module__ == module.__name__
+    ]
+
+    for cls in model_classes:
+        cls.model_rebuild()
+        assert cls.__pydantic_complete__, f"{cls.__name__} should be complete"
+        assert cls.model_rebuild() is None, (
+            f"{cls.__name__}.model_rebuild() should not rebuild the schema"
+        )
+
+
 def test_discriminated_union_validation_works(models_path):
     """
     Test that discriminated unions actually validate correctly at runtime.
     To ensure the patching produces functionally correct Pydantic models.
     """
 
-    spec = importlib.util.spec_from_file_location("models", models_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    module = load_models_module(models_path)
 
     # use coordinate transformation field as an example
     Identity = module.Identity
@@ -186,9 +216,7 @@ def test_type_alias_validation_works(models_path):
     Test that type aliases properly validate array shapes at runtime.
     """
 
-    spec = importlib.util.spec_from_file_location("models", models_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    module = load_models_module(models_path)
 
     PointSet3D = module.PointSet3D
 
@@ -218,6 +246,93 @@ def test_type_alias_validation_works(models_path):
         )
 
 
+def test_strip_field_descriptions():
+    """
+    Verify the optional description stripping removes Field descriptions,
+    including multi-line ones, but leaves class docstrings.
+    """
+    from model_processing.patch_models import strip_field_descriptions
+
+    model_def = (
+        "class Tomogram(ConfiguredBaseModel):\n"
+        '    """\n    A tomogram\n    """\n\n'
+        '    width: Optional[int] = Field(default=None, description="""Width""")\n'
+        "    path: Optional[str] = Field(\n"
+        '        default=None, description="""Path to the "file",\nmaybe relative"""\n'
+        "    )\n"
+    )
+
+    stripped = strip_field_descriptions(model_def)
+
+    assert "description" not in stripped
+    assert "A tomogram" in stripped
+    assert "width: Optional[int] = Field(default=None)" in stripped
+    ast.parse(stripped)
+
+
+def test_remove_unused_linkml_meta():
+    """
+    Verify LinkMLMeta is removed only when nothing else refers to it.
+    """
+    from model_processing.patch_models import remove_unused_linkml_meta
+
+    meta = (
+        "class LinkMLMeta(RootModel):\n"
+        "    root: dict[str, Any] = {}\n"
+        "\n"
+        "    def __contains__(self, key: str) -> bool:\n"
+        "        return key in self.root\n"
+        "\n\n"
+    )
+    unused = meta + "linkml_meta = None\n"
+    used = meta + "linkml_meta = LinkMLMeta({})\n"
+
+    assert remove_unused_linkml_meta(unused) == "linkml_meta = None\n"
+    assert remove_unused_linkml_meta(used) == used
+
+
+def test_patch_regexes_on_pathological_input():
+    """
+    Verify the patching regexes fail cleanly on long near-miss input, such as
+    an unterminated description or a field with lots of trailing whitespace,
+    leaving the text unchanged.
+    """
+    from model_processing.patch_models import (
+        optional_list_field_re,
+        strip_field_descriptions,
+    )
+
+    unterminated = ', description="""' + 'a "" ' * 50_000
+    assert strip_field_descriptions(unterminated) == unterminated
+
+    near_miss = "annotations:" + " " * 50_000 + "Optional[list[Annotation]"
+    assert optional_list_field_re("annotations").search(near_miss) is None
+
+
+@pytest.mark.parametrize(
+    "typing_import",
+    [
+        "from typing import Any, Optional",
+        "from typing import (\n    Any,\n    Optional\n)",
+    ],
+)
+def test_ensure_typing_imports(typing_import):
+    """
+    Verify missing typing names are added to both single-line and
+    parenthesized imports, decided by the imported names rather than by
+    a substring search of the module header.
+    """
+    from model_processing.patch_models import ensure_typing_imports
+
+    model_def = f'"""Literal Union of models"""\n{typing_import}\n\nx: Any = None\n'
+    patched = ensure_typing_imports(model_def)
+
+    match = re.search(r"from typing import \(?([^)]*?)\)?\n\n", patched)
+    imported = {name.strip() for name in match.group(1).split(",")}
+    assert imported == {"Any", "Optional", "Annotated", "Union", "TypeAlias", "Literal"}
+    assert ensure_typing_imports(patched) == patched
+
+
 @pytest.mark.skipif(
     not Path("schema/linkml").exists(), reason="Schema files not available"
 )
@@ -1,10 +1,30 @@
+import json
+import mrcfile
+import numpy as np
+import pytest
+import struct
+import warnings
+from dataclasses import FrozenInstanceError, asdict
+from pathlib import Path
+from PIL import Image
+from pydantic import ValidationError
+
 from src.cets_data_model.utils.image_utils import (
     get_image_dims,
     get_tiff_dims,
+    get_tiff_info,
     get_mrc_dims,
+    get_mrc_dims_batch,
+    clear_image_info_cache,
+    clear_mrc_dims_cache,
     check_file_is_mrc,
     check_file_is_tif,
+    get_em_file_info,
     get_image_info,
+    get_image_info_batch,
+    get_image_dims_batch,
+    get_mrc_info,
+    validate_mrc,
 )
 from src.cets_data_model.utils.coordinate_systems import (
     logical_coords,
@@ -16,7 +36,29 @@ from src.cets_data_model.utils.coordinate_systems import (
     Y_AXIS_LOGICAL,
     Z_AXIS_LOGICAL,
 )
-from cets_data_model.models.models import CoordinateSystem
+from cets_data_model.models.models import (
+    Affine,
+    Annotation,
+    CoordinateSystem,
+    Dataset,
+    PointMatrixSet3D,
+    PointSet3D,
+    Tomogram,
+)
+from cets_data_model.utils.array_utils import annotation_from_arrays, field_as_array
+from cets_data_model.utils.model_utils import (
+    ANNOTATION_CLASSES,
+    TRANSFORMATION_CLASSES,
+    dataset_from_json,
+    dataset_to_json,
+    list_adapter,
+    load_models_json,
+    parse_annotation,
+    parse_transformation,
+    read_dataset,
+    validate_rows,
+    write_dataset,
+)
 from tests.testing_tools import CetsDataModelTest
 
 
@@ -42,6 +84,17 @@ class UtilsTests(CetsDataModelTest):
         img = self.test_data / "single.tif"
         assert get_tiff_dims(img) == (32, 32, 1)
 
+    def test_get_tiff_dims_written_stacks(self):
+        frames = [Image.new("L", (6, 5)) for _ in range(7)]
+        for big_tiff in (False, True):
+            img = self.test_dir / f"stack_{big_tiff}.tif"
+            frames[0].save(
+                img, save_all=True, append_images=frames[1:], big_tiff=big_tiff
+            )
+            with Image.open(img) as tif:
+                assert tif.n_frames == 7
+            assert get_tiff_dims(img) == (6, 5, 7)
+
     def test_get_mrc_dims_2d(self):
         img = self.test_data / "single.mrc"
         assert get_mrc_dims(img) == (100, 100, 1)
@@ -50,19 +103,78 @@ class UtilsTests(CetsDataModelTest):
         img = self.test_data / "mrc_stack.mrcs"
         assert get_mrc_dims(img) == (64, 64, 215)
 
+    def test_get_mrc_dims_strict(self):
+        img = self.test_data / "mrc_stack.mrcs"
+        assert get_mrc_dims(img, strict=True) == get_mrc_dims(img)
+
+    def test_get_mrc_dims_bad_file(self):
+        with self.assertRaises(ValueError):
+            get_mrc_dims(self.test_data / "single.tif")
+
+    def test_get_mrc_dims_rewritten_file(self):
+        img = self.test_dir / "rewritten.mrc"
+        with mrcfile.new(img) as mrc:
+            mrc.set_data(np.zeros((3, 4, 5), dtype=np.float32))
+        assert get_mrc_dims(img) == (5, 4, 3)
+        with mrcfile.new(img, overwrite=True) as mrc:
+            mrc.set_data(np.zeros((6, 7, 8), dtype=np.float32))
+        assert get_mrc_dims(img) == (8, 7, 6)
+        clear_mrc_dims_cache()
+        assert get_mrc_dims(img) == (8, 7, 6)
+
+    def test_get_image_dims_file_type_changed(self):
+        img = self.test_dir / "image"
+        img.write_bytes((self.test_data / "single.tif").read_bytes())
+        assert get_image_dims(img) == (32, 32, 1)
+        with mrcfile.new(img, overwrite=True) as mrc:
+            mrc.set_data(np.zeros((3, 4, 5), dtype=np.float32))
+        assert get_image_dims(img) == (5, 4, 3)
+        assert get_image_info(img).size_z == 3
+
+    def test_get_image_info_cached(self):
+        img = self.test_dir / "cached.mrc"
+        with mrcfile.new(img) as mrc:
+            mrc.set_data(np.zeros((3, 4, 5), dtype=np.float32))
+        info = get_image_info(img)
+        with self.assertRaises(FrozenInstanceError):
+            info.size_x = 0
+        assert get_image_info(img) is info
+        with mrcfile.new(img, overwrite=True) as mrc:
+            mrc.set_data(np.zeros((6, 7, 8), dtype=np.float32))
+        assert get_image_info(img).size_x == 8
+        clear_image_info_cache()
+        assert get_image_info(img).size_x == 8
+
+    def test_get_mrc_dims_batch(self):
+        imgs = [self.test_data / "mrc_stack.mrcs", self.test_data / "single.mrc"]
+        assert get_mrc_dims_batch(imgs) == [(64, 64, 215), (100, 100, 1)]
+
+    def test_get_mrc_dims_batch_threaded(self):
+        imgs = [self.test_data / "mrc_stack.mrcs", self.test_data / "single.mrc"] * 3
+        assert get_mrc_dims_batch(imgs, max_workers=4) == get_mrc_dims_batch(imgs)
+
+    def test_get_mrc_dims_batch_bad_file(self):
+        with self.assertRaises(ValueError):
+            get_mrc_dims_batch([self.test_data / "single.tif"])
+
     def test_check_file_is_mrc(self):
         assert check_file_is_mrc(str(self.test_data / "mrc_stack.mrcs"))
         assert check_file_is_mrc(str(self.test_data / "single.mrc"))
         assert not check_file_is_mrc(str(self.test_data / "single.tif"))
+        assert not check_file_is_mrc(self.test_data / "null.txt")
+        assert not check_file_is_mrc(self.test_data / "missing.mrc")
 
     def test_check_file_is_tiff(self):
         assert not check_file_is_tif(str(self.test_data / "mrc_stack.mrcs"))
         assert not check_file_is_tif(str(self.test_data / "single.mrc"))
         assert check_file_is_tif(str(self.test_data / "single.tif"))
+        assert check_file_is_tif(self.test_data / "tiff_stack.tiff")
+        assert not check_file_is_tif(self.test_data / "null.txt")
+        assert not check_file_is_tif(self.test_data / "missing.tif")
 
     def test_get_image_stats_mrc(self):
         img = self.test_data / "mrc_stack.mrcs"
-        assert get_image_info(img).__dict__ == {
+        assert asdict(get_image_info(img)) == {
             "size_x": 64,
             "size_y": 64,
             "size_z": 215,
@@ -75,7 +187,7 @@ class UtilsTests(CetsDataModelTest):
 
     def test_get_image_stats_mrc_single(self):
         img = self.test_data / "single.mrc"
-        assert get_image_info(img).__dict__ == {
+        assert asdict(get_image_info(img)) == {
             "size_x": 100,
             "size_y": 100,
             "size_z": 1,
@@ -86,10 +198,90 @@ class UtilsTests(CetsDataModelTest):
             "apix_z": None,
         }
 
+    def test_get_mrc_info_volume_apix(self):
+        img = self.test_dir / "volume.mrc"
+        with mrcfile.new(img) as mrc:
+            mrc.set_data(np.zeros((4, 8, 8), dtype=np.float32))
+            mrc.voxel_size = (2.0, 2.0, 5.0)
+        info = get_mrc_info(img)
+        assert (info.apix_x, info.apix_y, info.apix_z) == (2.0, 2.0, 5.0)
+
+    def test_get_mrc_info_no_sampling(self):
+        img = self.test_dir / "no_sampling.mrc"
+        with mrcfile.new(img) as mrc:
+            mrc.set_data(np.zeros((4, 8, 8), dtype=np.float32))
+            mrc.header.mx = mrc.header.my = mrc.header.mz = 0
+        info = get_mrc_info(img)
+        assert (info.apix_x, info.apix_y, info.apix_z) == (None, None, None)
+
+    def test_get_mrc_info_strict(self):
+        for name in ("mrc_stack.mrcs", "single.mrc"):
+            img = self.test_data / name
+            assert get_mrc_info(img) == get_mrc_info(img, strict=True)
+
+    def test_get_mrc_info_validate(self):
+        img = self.test_data / "mrc_stack.mrcs"
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            header_info = get_mrc_info(img)
+        with self.assertWarns(UserWarning):
+            validated_info = get_mrc_info(img, validate=True)
+        assert header_info == validated_info
+
+    def test_get_image_info_batch(self):
+        imgs = [
+            self.test_data / "mrc_stack.mrcs",
+            self.test_data / "single.mrc",
+            self.test_data / "tiff_stack.tiff",
+        ] * 2
+        expected = [get_image_info(img) for img in imgs]
+        assert get_image_info_batch(imgs) == expected
+        assert get_image_info_batch(imgs, max_workers=4) == expected
+
+    def test_get_image_dims_batch(self):
+        imgs = [self.test_data / "mrc_stack.mrcs", self.test_data / "single.tif"] * 2
+        expected = [(64, 64, 215), (32, 32, 1)] * 2
+        assert get_image_dims_batch(imgs) == expected
+        assert get_image_dims_batch(imgs, max_workers=4) == expected
+
+    def test_validate_mrc(self):
+        errors = validate_mrc(self.test_data / "mrc_stack.mrcs")
+        assert any("MRC format version" in error for error in errors)
+        img = self.test_dir / "valid.mrc"
+        with mrcfile.new(img) as mrc:
+            mrc.set_data(np.zeros((4, 8, 8), dtype=np.float32))
+        assert validate_mrc(img) == []
+
+    def test_get_em_file_info(self):
+        img = self.test_dir / "volume.em"
+        header = bytes([6, 0, 0, 5]) + struct.pack("<3i", 10, 20, 30)
+        header += bytes(24) + struct.pack("<3i", 25, 50, 75)
+        img.write_bytes(header.ljust(512, b"\x00") + bytes(10 * 20 * 30 * 4))
+        expected = {
+            "size_x": 10,
+            "size_y": 20,
+            "size_z": 30,
+            "mode": "5",
+            "mode_desc": str(np.float32),
+            "apix_x": 2.5,
+            "apix_y": 2.5,
+            "apix_z": 2.5,
+        }
+        assert asdict(get_em_file_info(img)) == expected
+        assert asdict(get_image_info(img)) == expected
+
+    def test_get_tiff_info_apix(self):
+        img = self.test_dir / "apix.tif"
+        Image.new("L", (4, 4)).save(img, dpi=(2.54e8 / 2.0, 2.54e8 / 2.0))
+        assert get_tiff_info(img).apix_x == pytest.approx(2.0)
+        Image.new("L", (4, 4)).save(img, dpi=(72, 72))
+        assert get_tiff_info(img).apix_x is None
+        assert get_tiff_info(self.test_data / "single.tif").apix_x is None
+
     def test_get_image_stats_tiff(self):
         """Test tiff image doesn't contain pixel size in header, which is common"""
         img = self.test_data / "tiff_stack.tiff"
-        assert get_image_info(img).__dict__ == {
+        assert asdict(get_image_info(img)) == {
             "size_x": 78,
             "size_y": 78,
             "size_z": 24,
@@ -138,3 +330,138 @@ def test_make_coordinate_system_3d_phyical():
     assert physical_coords(name="coords", dim=3) == CoordinateSystem(
         name="coords", axes=[X_AXIS_PHYSICAL, Y_AXIS_PHYSICAL, Z_AXIS_PHYSICAL]
     )
+
+
+def test_load_models_json():
+    data = b'[{"id": "tomo_1", "width": 512}, {"id": "tomo_2", "depth": 128}]'
+    assert load_models_json(Tomogram, data) == [
+        Tomogram(id="tomo_1", width=512),
+        Tomogram(id="tomo_2", depth=128),
+    ]
+
+
+def test_load_models_json_invalid_item():
+    with pytest.raises(ValidationError):
+        load_models_json(Tomogram, '[{"id": "tomo_1"}, {"width": "wide"}]')
+
+
+def test_validate_rows():
+    rows = [{"id": f"tomo_{i}", "width": 512} for i in range(3)]
+    tomograms = validate_rows(Tomogram, rows)
+    assert [t.id for t in tomograms] == ["tomo_0", "tomo_1", "tomo_2"]
+
+    with pytest.raises(ValidationError):
+        validate_rows(Tomogram, [{"id": "tomo_1", "extra_field": 1}])
+
+
+def test_annotation_classes():
+    assert ANNOTATION_CLASSES["point_set_3D"] is PointSet3D
+    assert set(ANNOTATION_CLASSES.values()) == set(Annotation.__subclasses__())
+
+
+def test_transformation_classes():
+    assert TRANSFORMATION_CLASSES["affine"] is Affine
+    assert set(TRANSFORMATION_CLASSES) == {
+        "identity",
+        "map_axis",
+        "translation",
+        "scale",
+        "affine",
+        "sequence",
+    }
+
+
+def test_parse_annotation():
+    annotation = parse_annotation(
+        {"annotation_type": "point_set_3D", "origin3D": [[1.0, 2.0, 3.0]]}
+    )
+    assert isinstance(annotation, PointSet3D)
+
+    with pytest.raises(ValidationError):
+        parse_annotation({"annotation_type": "not_an_annotation"})
+
+
+def test_parse_transformation():
+    identity = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    transformation = parse_transformation(
+        {"transformation_type": "affine", "affine": identity}
+    )
+    assert isinstance(transformation, Affine)
+
+
+def test_list_adapter_is_cached():
+    assert list_adapter(Tomogram) is list_adapter(Tomogram)
+
+
+def test_read_dataset():
+    json_file = Path(__file__).parent / "test_data" / "expected_dataset.json"
+    with open(json_file) as f:
+        expected = Dataset.model_validate(json.load(f))
+    assert read_dataset(json_file) == expected
+
+
+def test_write_dataset_round_trip(tmp_path):
+    json_file = Path(__file__).parent / "test_data" / "expected_dataset.json"
+    dataset = read_dataset(json_file)
+    data = dataset_to_json(dataset)
+    assert isinstance(data, bytes)
+    assert json.loads(data) == json.loads(dataset.model_dump_json())
+    assert dataset_from_json(data) == dataset
+
+    out_file = tmp_path / "dataset.json"
+    write_dataset(dataset, out_file, indent=2)
+    assert read_dataset(out_file) == dataset
+
+
+def test_field_as_array():
+    points = PointSet3D(
+        annotation_type="point_set_3D", origin3D=[[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    )
+    arr = field_as_array(points, "origin3D", dtype=np.float32)
+    assert arr.shape == (2, 3)
+    assert arr.dtype == np.float32
+    np.testing.assert_array_equal(arr[1], [4.0, 5.0, 6.0])
+
+
+def test_field_as_array_matrices():
+    identity = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    matrices = PointMatrixSet3D(
+        annotation_type="point_matrix_set_3D",
+        origin3D=[[0.0, 0.0, 0.0]],
+        matrix3D=[identity],
+    )
+    assert field_as_array(matrices, "matrix3D").shape == (1, 3, 3)
+    assert (
+        field_as_array(PointSet3D(annotation_type="point_set_3D"), "origin3D") is None
+    )
+
+
+def test_field_as_array_bad_field():
+    with pytest.raises(ValueError):
+        field_as_array(Tomogram(id="tomo_1"), "width")
+
+
+def test_annotation_from_arrays():
+    points = np.arange(6, dtype=np.float32).reshape(2, 3)
+    from_arrays = annotation_from_arrays(
+        PointSet3D, {"origin3D": points}, annotation_type="point_set_3D", name="pts"
+    )
+    assert from_arrays == PointSet3D(
+        annotation_type="point_set_3D",
+        name="pts",
+        origin3D=[[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]],
+    )
+    assert type(from_arrays.origin3D[0][0]) is float
+
+
+def test_annotation_from_arrays_bad_shape():
+    with pytest.raises(ValueError):
+        annotation_from_arrays(
+            PointSet3D, {"origin3D": np.zeros((4, 2))}, annotation_type="point_set_3D"
+        )
+    with pytest.raises(ValueError):
+        annotation_from_arrays(
+            PointSet3D,
+            {"matrix3D": np.zeros((1, 3, 3))},
+            annotation_type="point_set_3D",
+        )